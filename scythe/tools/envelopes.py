@@ -1,4 +1,16 @@
-"""Envelope and automation tools."""
+"""Envelope and automation tools.
+
+Performance invariants
+----------------------
+Every tool here is bound by reapy round-trips to REAPER, not by Python
+CPU time, so changes should be justified by fewer RPCs or fewer bytes
+over the reapy connection:
+
+1. Prefer one ``GetEnvelopeStateChunk`` / ``SetEnvelopeStateChunk``
+   pair over loops of per-point or per-property accessors.
+2. Compile regexes at module scope.
+3. Never import ``reapy.reascript_api`` inside a tool function.
+"""
 
 from __future__ import annotations
 
@@ -8,6 +20,7 @@ from typing import Annotated
 from pydantic import Field
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
+import reapy.reascript_api as RPR
 
 from scythe.helpers import get_project, validate_track_index, validate_fx_index, undo_block
 
@@ -45,22 +58,43 @@ ParamIndex = Annotated[int, Field(description="Zero-based FX parameter index", g
 # Shape label lookup (for readable output)
 # ---------------------------------------------------------------------------
 
-_SHAPE_NAMES = {
-    0: "linear",
-    1: "square",
-    2: "slow start/end",
-    3: "fast start",
-    4: "fast end",
-    5: "bezier",
-}
+# Indexed by shape / mode number -- both ranges are contiguous from 0
+_SHAPE_NAMES = (
+    "linear",
+    "square",
+    "slow start/end",
+    "fast start",
+    "fast end",
+    "bezier",
+)
 
-_AUTOMATION_MODE_NAMES = {
-    0: "trim/off",
-    1: "read",
-    2: "touch",
-    3: "write",
-    4: "latch",
-}
+_AUTOMATION_MODE_NAMES = (
+    "trim/off",
+    "read",
+    "touch",
+    "write",
+    "latch",
+)
+
+
+# ---------------------------------------------------------------------------
+# State chunk patterns
+# ---------------------------------------------------------------------------
+
+# list_track_envelopes reads the whole track chunk only below these limits
+_TRACK_CHUNK_MAX_ITEMS = 8
+_TRACK_CHUNK_MAX_BYTES = 1 << 20
+
+_RE_PARMENV = re.compile(r'^<PARMENV\s+\S+\s+([\d.eE+-]+)\s+([\d.eE+-]+)')
+_RE_ENV_BLOCK = re.compile(r'<[A-Z0-9_]*ENV[A-Z0-9_]*\b')
+# PT <time> <value> [<shape> [<timesig> <selected> [<unused> <tension>]]]
+_RE_PT_LINE = re.compile(
+    r'^[ \t]*PT[ \t]+(\S+)[ \t]+(\S+)'
+    r'(?:[ \t]+(\S+)'
+    r'(?:[ \t]+\S+[ \t]+(\S+)'
+    r'(?:[ \t]+\S+[ \t]+(\S+))?)?)?',
+    re.M,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -70,8 +104,6 @@ _AUTOMATION_MODE_NAMES = {
 
 def _validate_envelope_index(track, envelope_index: int):
     """Return the envelope ID at *envelope_index* on *track*, or raise ToolError."""
-    import reapy.reascript_api as RPR
-
     n = RPR.CountTrackEnvelopes(track.id)
     if envelope_index < 0 or envelope_index >= n:
         raise ToolError(
@@ -82,6 +114,111 @@ def _validate_envelope_index(track, envelope_index: int):
     return RPR.GetTrackEnvelope(track.id, envelope_index)
 
 
+def _get_envelope_chunk(env_id, buf_sz: int = 65536) -> str:
+    """Return the state chunk of *env_id* as a string ("" on failure)."""
+    ret = RPR.GetEnvelopeStateChunk(env_id, "", buf_sz, False)
+    # reapy returns a list [retval, env_id, chunk_str, buf_sz, isUndo]
+    if isinstance(ret, (list, tuple)):
+        return ret[2] if len(ret) >= 3 else ret[0]
+    return str(ret)
+
+
+def _parse_envelope_points(chunk: str) -> list[dict] | None:
+    """Parse every ``PT`` line of an envelope state chunk into point dicts.
+
+    Point lines have the form ``PT <time> <value> <shape> [<timesig>
+    <selected> <unused> <tension>]`` -- trailing fields are omitted by
+    REAPER when they are zero.  Returns None if *chunk* is empty or
+    truncated (no closing ``>``), so the caller can fall back to the
+    per-point API.
+    """
+    if not chunk or not chunk.rstrip().endswith(">"):
+        return None
+
+    # One findall scans the whole chunk in the regex engine; only the
+    # per-point conversions run as Python bytecode.
+    rows = _RE_PT_LINE.findall(chunk)
+    points = [None] * len(rows)
+    shape_names = _SHAPE_NAMES  # local: LOAD_FAST inside the loop
+    for i, (time, value, shape, selected, tension) in enumerate(rows):
+        shape = int(shape) if shape else 0
+        points[i] = {
+            "index": i,
+            "time": float(time),
+            "value": float(value),
+            "shape": shape,
+            "shape_name": shape_names[shape] if 0 <= shape < len(shape_names) else "unknown",
+            "tension": float(tension) if tension else 0.0,
+            "selected": bool(int(selected) & 1) if selected else False,
+        }
+    return points
+
+
+def _track_envelope_point_counts(chunk: str) -> list[tuple[str, int]] | None:
+    """Count the ``PT`` lines of every envelope block in a track state chunk.
+
+    Returns ``(tag, n_points)`` per envelope block (``VOLENV2``,
+    ``PANENV2``, ``PARMENV`` inside the FX chain, ``AUXVOLENV`` ...) in
+    chunk order.  Take envelopes inside ``<ITEM`` blocks are skipped.
+    Returns None if *chunk* is empty or truncated.
+    """
+    if not chunk or not chunk.rstrip().endswith(">"):
+        return None
+
+    counts: list[tuple[str, int]] = []
+    depth = 0
+    env_depth = 0   # depth of the envelope block being read, 0 = none
+    item_depth = 0  # depth of the <ITEM block being skipped, 0 = none
+    n = 0
+    for line in chunk.splitlines():
+        line = line.strip()
+        if line.startswith("<"):
+            depth += 1
+            if env_depth or item_depth:
+                continue
+            if line.startswith("<ITEM"):
+                item_depth = depth
+            elif _RE_ENV_BLOCK.match(line):
+                env_depth = depth
+                counts.append((line[1:].split(None, 1)[0], 0))
+                n = 0
+        elif line == ">":
+            if depth == env_depth:
+                counts[-1] = (counts[-1][0], n)
+                env_depth = 0
+            elif depth == item_depth:
+                item_depth = 0
+            depth -= 1
+        elif depth == env_depth and line.startswith("PT "):
+            n += 1
+    return counts
+
+
+# GetEnvelopeName for the fixed track envelopes, by state chunk tag
+_ENV_TAG_NAMES = {
+    "VOLENV2": "Volume",
+    "VOLENV": "Volume (Pre-FX)",
+    "VOLENV3": "Trim Volume",
+    "PANENV2": "Pan",
+    "PANENV": "Pan (Pre-FX)",
+    "WIDTHENV2": "Width",
+    "WIDTHENV": "Width (Pre-FX)",
+    "MUTEENV": "Mute",
+}
+_FIXED_ENV_NAMES = frozenset(_ENV_TAG_NAMES.values())
+
+
+def _env_tag_matches(tag: str, name: str) -> bool:
+    """Whether a chunk block *tag* plausibly belongs to envelope *name*."""
+    expected = _ENV_TAG_NAMES.get(tag)
+    if expected is not None:
+        return name == expected
+    if tag.startswith("AUX"):
+        return name.startswith("Send")
+    # FX parameter (PARMENV) and other envelopes carry free-form names
+    return name not in _FIXED_ENV_NAMES
+
+
 def _get_parmenv_range(env_id) -> tuple[float, float] | None:
     """If *env_id* is an FX parameter envelope, return (min_val, max_val).
 
@@ -89,15 +226,9 @@ def _get_parmenv_range(env_id) -> tuple[float, float] | None:
     envelope's state chunk.  Returns None for non-FX envelopes (volume,
     pan, etc.).
     """
-    import reapy.reascript_api as RPR
-
-    ret = RPR.GetEnvelopeStateChunk(env_id, "", 65536, False)
-    if isinstance(ret, (list, tuple)):
-        chunk = ret[2] if len(ret) >= 3 else ret[0]
-    else:
-        chunk = str(ret)
+    chunk = _get_envelope_chunk(env_id)
 
-    m = re.match(r'^<PARMENV\s+\S+\s+([\d.eE+-]+)\s+([\d.eE+-]+)', chunk)
+    m = _RE_PARMENV.match(chunk)
     if m:
         return float(m.group(1)), float(m.group(2))
     return None
@@ -117,51 +248,109 @@ def _normalized_to_raw(value: float, env_id) -> float:
     return min_val + value * (max_val - min_val)
 
 
+def _set_chunk_field(buf: bytearray, key: bytes, value: bytes) -> bool:
+    """Overwrite the first field of the *key* line in *buf*, in place.
+
+    Only matches *key* at the start of a line, so ``VIS`` never hits
+    ``LVIS``.  Returns False if the chunk has no such line.
+    """
+    start = buf.find(b"\n" + key + b" ")
+    if start == -1:
+        return False
+    start += len(key) + 2
+    end = start
+    n = len(buf)
+    while end < n and buf[end] not in b" \r\n":
+        end += 1
+    buf[start:end] = value
+    return True
+
+
 def _edit_envelope_chunk(env_id, *, active: bool | None = None,
                          visible: bool | None = None,
                          default_shape: int | None = None) -> str:
     """Read an envelope's state chunk, apply edits, write it back.
 
-    Returns the modified chunk string.  Regex patterns use line-start
-    anchors (``(?m)^``) to avoid matching substrings like LVIS or
-    VOLENV2_ACT.
+    Edits are spliced into one bytearray copy of the chunk instead of
+    building a new string per directive.  Returns the modified chunk
+    string.
     """
-    import reapy.reascript_api as RPR
-
-    ret = RPR.GetEnvelopeStateChunk(env_id, "", 65536, False)
-    # reapy returns a list [retval, env_id, chunk_str, buf_sz, isUndo]
-    if isinstance(ret, (list, tuple)):
-        chunk = ret[2] if len(ret) >= 3 else ret[0]
-    else:
-        chunk = str(ret)
-
+    chunk = _get_envelope_chunk(env_id)
     if not chunk:
         raise ToolError("Failed to read envelope state chunk.")
 
+    buf = bytearray(chunk, "utf-8")
+
     if active is not None:
-        val = "1" if active else "0"
-        chunk = re.sub(r'(?m)^(ACT )\d', rf'\g<1>{val}', chunk)
+        _set_chunk_field(buf, b"ACT", b"1" if active else b"0")
 
     if visible is not None:
-        val = "1" if visible else "0"
-        chunk = re.sub(r'(?m)^(VIS )\d', rf'\g<1>{val}', chunk)
+        _set_chunk_field(buf, b"VIS", b"1" if visible else b"0")
 
     if default_shape is not None:
-        if re.search(r'(?m)^DEFSHAPE ', chunk):
-            chunk = re.sub(
-                r'(?m)^(DEFSHAPE )\d+',
-                rf'\g<1>{default_shape}',
-                chunk,
-            )
-        else:
+        if not _set_chunk_field(buf, b"DEFSHAPE", b"%d" % default_shape):
             # Insert DEFSHAPE before the closing >
-            chunk = chunk.rstrip().rstrip('>').rstrip()
-            chunk += f'\nDEFSHAPE {default_shape}\n>'
+            close = buf.rfind(b"\n>")
+            if close == -1:
+                close = buf.rfind(b">")
+                if close == -1:
+                    raise ToolError("Malformed envelope state chunk.")
+            buf[close:] = b"\nDEFSHAPE %d\n>" % default_shape
+
+    chunk = buf.decode("utf-8")
+    RPR.SetEnvelopeStateChunk(env_id, chunk, False)
+    return chunk
+
+
+def _bulk_chunk_edit(env_id, edits: list[tuple[re.Pattern, str]]) -> str:
+    """Apply several ``(pattern, replacement)`` edits with one get/set pair.
+
+    Each edit is a ``pattern.sub(replacement, chunk)`` on the envelope's
+    state chunk; all of them are applied before the single
+    ``SetEnvelopeStateChunk``.  For tools that rewrite directives
+    ``_edit_envelope_chunk`` does not cover.  Returns the modified chunk
+    string.
+    """
+    chunk = _get_envelope_chunk(env_id)
+    if not chunk:
+        raise ToolError("Failed to read envelope state chunk.")
+
+    for pattern, replacement in edits:
+        chunk = pattern.sub(replacement, chunk)
 
     RPR.SetEnvelopeStateChunk(env_id, chunk, False)
     return chunk
 
 
+def _set_envelope_act_vis(env_id, active: bool, visible: bool) -> None:
+    """Set only the ACT and VIS flags of an envelope.
+
+    Fast path for callers that always write both flags: one scan over
+    the chunk's lines, stopping once both have been rewritten.
+    """
+    chunk = _get_envelope_chunk(env_id)
+    if not chunk:
+        raise ToolError("Failed to read envelope state chunk.")
+
+    act = "ACT 1" if active else "ACT 0"
+    vis = "VIS 1" if visible else "VIS 0"
+    lines = chunk.split("\n")
+    remaining = 2
+    for i, line in enumerate(lines):
+        if line.startswith("ACT "):
+            lines[i] = act + line[5:]
+            remaining -= 1
+        elif line.startswith("VIS "):
+            lines[i] = vis + line[5:]
+            remaining -= 1
+        else:
+            continue
+        if not remaining:
+            break
+
+    RPR.SetEnvelopeStateChunk(env_id, "\n".join(lines), False)
+
+
 # ---------------------------------------------------------------------------
 # Read-only queries
 # ---------------------------------------------------------------------------
@@ -174,25 +363,52 @@ def list_track_envelopes(
     """List all envelopes on a track.
 
     Returns each envelope's index, name, point count, and internal
-    envelope ID.
+    envelope ID.  On tracks with few items, point counts for all
+    envelopes are taken from a single read of the track state chunk.
     """
     try:
-        import reapy.reascript_api as RPR
-
         project = get_project()
         track = validate_track_index(project, track_index)
 
         n_envelopes = RPR.CountTrackEnvelopes(track.id)
+        env_ids = [None] * n_envelopes
+        names = [None] * n_envelopes
+        for i in range(n_envelopes):
+            env_ids[i] = RPR.GetTrackEnvelope(track.id, i)
+            _, _, names[i], _ = RPR.GetEnvelopeName(env_ids[i], "", 256)
+
+        # The track chunk also carries every item (MIDI included), so it is
+        # only read for lightly loaded tracks, and capped; a truncated read
+        # parses as None and drops to the per-envelope count
+        point_counts = None
+        if n_envelopes and RPR.CountTrackMediaItems(track.id) <= _TRACK_CHUNK_MAX_ITEMS:
+            ret = RPR.GetTrackStateChunk(track.id, "", _TRACK_CHUNK_MAX_BYTES, False)
+            # reapy returns a list [retval, track, chunk_str, buf_sz, isUndo]
+            chunk = ret[2] if isinstance(ret, (list, tuple)) and len(ret) >= 3 else ""
+            blocks = _track_envelope_point_counts(chunk)
+            # Chunk order is assumed to be GetTrackEnvelope order -- only
+            # trusted when every block's tag agrees with the envelope name
+            if (
+                blocks is not None
+                and len(blocks) == n_envelopes
+                and all(_env_tag_matches(tag, name) for (tag, _), name in zip(blocks, names))
+            ):
+                point_counts = [count for _, count in blocks]
+
         envelopes = []
         for i in range(n_envelopes):
-            env_id = RPR.GetTrackEnvelope(track.id, i)
-            _, _, buf, _ = RPR.GetEnvelopeName(env_id, "", 256)
-            n_points = RPR.CountEnvelopePoints(env_id)
+            if point_counts is not None:
+                n_points = point_counts[i]
+            else:
+                # Envelope chunks carry no NAME line, so reading one per
+                # envelope would not save the GetEnvelopeName call --
+                # CountEnvelopePoints is the cheaper round-trip here.
+                n_points = RPR.CountEnvelopePoints(env_ids[i])
             envelopes.append({
                 "index": i,
-                "name": buf,
+                "name": names[i],
                 "n_points": n_points,
-                "envelope_id": str(env_id),
+                "envelope_id": str(env_ids[i]),
             })
         return {"n_envelopes": n_envelopes, "envelopes": envelopes}
     except ToolError:
@@ -211,33 +427,36 @@ def get_envelope_points(
     Returns each point's index, time, value, shape, tension, and
     selected state. Shape values: 0=linear, 1=square, 2=slow start/end,
     3=fast start, 4=fast end, 5=bezier.
+
+    Points are parsed from the envelope state chunk in a single call;
+    the per-point API is only used if the chunk cannot be read.
     """
     try:
-        import reapy.reascript_api as RPR
-
         project = get_project()
         track = validate_track_index(project, track_index)
         env_id = _validate_envelope_index(track, envelope_index)
 
+        points = _parse_envelope_points(_get_envelope_chunk(env_id, 1 << 20))
+        if points is not None:
+            return {"n_points": len(points), "points": points}
+
+        # Fallback: one GetEnvelopePoint round-trip per point
         n_points = RPR.CountEnvelopePoints(env_id)
-        points = []
+        points = [None] * n_points
+        shape_names = _SHAPE_NAMES  # local: LOAD_FAST inside the loop
         for i in range(n_points):
             ret = RPR.GetEnvelopePoint(env_id, i, 0.0, 0.0, 0, 0.0, False)
             # ret: [retval, env_id, pt_idx, time, value, shape, tension, selected]
-            time = ret[3]
-            value = ret[4]
             shape = ret[5]
-            tension = ret[6]
-            selected = ret[7]
-            points.append({
+            points[i] = {
                 "index": i,
-                "time": time,
-                "value": value,
+                "time": ret[3],
+                "value": ret[4],
                 "shape": shape,
-                "shape_name": _SHAPE_NAMES.get(shape, "unknown"),
-                "tension": tension,
-                "selected": selected,
-            })
+                "shape_name": shape_names[shape] if 0 <= shape < len(shape_names) else "unknown",
+                "tension": ret[6],
+                "selected": ret[7],
+            }
         return {"n_points": n_points, "points": points}
     except ToolError:
         raise
@@ -261,13 +480,11 @@ def add_envelope_point(
 ) -> dict:
     """Add a point to a track envelope.
 
-    The point is inserted and the envelope is sorted afterwards.
+    REAPER keeps the envelope sorted as the point is inserted.
     Shape values: 0=linear, 1=square, 2=slow start/end, 3=fast start,
     4=fast end, 5=bezier.
     """
     try:
-        import reapy.reascript_api as RPR
-
         project = get_project()
         track = validate_track_index(project, track_index)
         env_id = _validate_envelope_index(track, envelope_index)
@@ -278,14 +495,13 @@ def add_envelope_point(
             RPR.InsertEnvelopePoint(
                 env_id, time, raw_value, shape, tension,
                 False,  # selected
-                True,   # noSort -- we sort manually after
+                False,  # noSort -- let REAPER place the single point
             )
-            RPR.Envelope_SortPoints(env_id)
         return {
             "time": time,
             "value": value,
             "shape": shape,
-            "shape_name": _SHAPE_NAMES.get(shape, "unknown"),
+            "shape_name": _SHAPE_NAMES[shape] if 0 <= shape < len(_SHAPE_NAMES) else "unknown",
             "tension": tension,
         }
     except ToolError:
@@ -307,8 +523,6 @@ def delete_envelope_points(
     be permanently removed.
     """
     try:
-        import reapy.reascript_api as RPR
-
         if time_end <= time_start:
             raise ToolError(
                 f"time_end ({time_end}) must be greater than time_start ({time_start})."
@@ -350,8 +564,6 @@ def create_fx_envelope(
     returned as-is (no duplicate is created).
     """
     try:
-        import reapy.reascript_api as RPR
-
         project = get_project()
         track = validate_track_index(project, track_index)
         fx = validate_fx_index(track, fx_index)
@@ -418,7 +630,9 @@ def create_fx_envelope(
             "n_points": n_points,
             "activated": activate,
             "default_shape": default_shape,
-            "default_shape_name": _SHAPE_NAMES.get(default_shape, "unknown"),
+            "default_shape_name": (
+                _SHAPE_NAMES[default_shape] if 0 <= default_shape < len(_SHAPE_NAMES) else "unknown"
+            ),
         }
     except ToolError:
         raise
@@ -444,8 +658,6 @@ def delete_envelope(
     The lane still exists in the track but will be invisible and inactive.
     """
     try:
-        import reapy.reascript_api as RPR
-
         project = get_project()
         track = validate_track_index(project, track_index)
         env_id = _validate_envelope_index(track, envelope_index)
@@ -454,7 +666,7 @@ def delete_envelope(
 
         with undo_block(f"Deactivate envelope '{env_name}' on track '{track.name}'"):
             RPR.DeleteEnvelopePointRangeEx(env_id, -1, 0.0, float('inf'))
-            _edit_envelope_chunk(env_id, active=False, visible=False)
+            _set_envelope_act_vis(env_id, active=False, visible=False)
 
         return {
             "track_index": track_index,
@@ -500,8 +712,6 @@ def set_envelope_properties(
     At least one of active, visible, or default_shape must be provided.
     """
     try:
-        import reapy.reascript_api as RPR
-
         if active is None and visible is None and default_shape is None:
             raise ToolError(
                 "At least one of 'active', 'visible', or 'default_shape' "
@@ -533,7 +743,7 @@ def set_envelope_properties(
             "visible": visible,
             "default_shape": default_shape,
             "default_shape_name": (
-                _SHAPE_NAMES.get(default_shape, "unknown")
+                (_SHAPE_NAMES[default_shape] if 0 <= default_shape < len(_SHAPE_NAMES) else "unknown")
                 if default_shape is not None
                 else None
             ),
@@ -570,8 +780,6 @@ def add_fx_envelope_points(
     for efficiency.  Optionally clear all existing points first.
     """
     try:
-        import reapy.reascript_api as RPR
-
         if not points:
             raise ToolError("The 'points' list must not be empty.")
 
@@ -583,9 +791,14 @@ def add_fx_envelope_points(
 
         # Detect FX param range for normalized → raw conversion
         parm_range = _get_parmenv_range(env_id)
+        if parm_range is not None:
+            min_val, max_val = parm_range
+            span = max_val - min_val
+        else:
+            min_val, span = 0.0, 1.0  # non-FX envelope -- identity mapping
 
         # Validate all points before mutating
-        validated = []
+        validated = [None] * len(points)
         for i, pt in enumerate(points):
             if "time" not in pt or "value" not in pt:
                 raise ToolError(
@@ -610,12 +823,7 @@ def add_fx_envelope_points(
                     f"got {tension}."
                 )
             # Convert normalized → raw for FX parameter envelopes
-            if parm_range is not None:
-                min_val, max_val = parm_range
-                raw_value = min_val + value * (max_val - min_val)
-            else:
-                raw_value = value
-            validated.append((time, raw_value, shape, tension))
+            validated[i] = (time, min_val + value * span, shape, tension)
 
         with undo_block(
             f"Add {len(validated)} envelope points to '{env_name}' "
@@ -664,8 +872,6 @@ def set_track_automation_mode(
     Modes: 0=trim/off, 1=read, 2=touch, 3=write, 4=latch.
     """
     try:
-        import reapy.reascript_api as RPR
-
         project = get_project()
         track = validate_track_index(project, track_index)
 
@@ -674,7 +880,7 @@ def set_track_automation_mode(
         return {
             "track_index": track_index,
             "mode": mode,
-            "mode_name": _AUTOMATION_MODE_NAMES.get(mode, "unknown"),
+            "mode_name": _AUTOMATION_MODE_NAMES[mode] if 0 <= mode < len(_AUTOMATION_MODE_NAMES) else "unknown",
         }
     except ToolError:
         raise
@@ -700,8 +906,6 @@ def add_automation_item(
     and length. Returns the index of the newly created automation item.
     """
     try:
-        import reapy.reascript_api as RPR
-
         project = get_project()
         track = validate_track_index(project, track_index)
         env_id = _validate_envelope_index(track, envelope_index)
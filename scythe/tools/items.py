@@ -186,6 +186,53 @@ def delete_item(
         raise ToolError(f"Failed to delete item: {exc}") from exc
 
 
+@mcp.tool(annotations={"readOnlyHint": False, "destructiveHint": True, "openWorldHint": False})
+def delete_items(
+    track_index: TrackIndex,
+    item_indices: Annotated[
+        list[int],
+        Field(description="Zero-based indices of the items to delete on the track"),
+    ],
+) -> dict:
+    """Delete several media items from the specified track at once.
+
+    All items are deleted inside a single undo block.  Every index is
+    validated before anything is removed.
+
+    WARNING: This permanently removes the items and all their takes.
+    """
+    try:
+        if not item_indices:
+            raise ToolError("The 'item_indices' list must not be empty.")
+
+        project = get_project()
+        track = validate_track_index(project, track_index)
+        with reapy.inside_reaper():
+            n = RPR.CountTrackMediaItems(track.id)
+            # Highest index first, so each deletion leaves the rest in place
+            targets = sorted(set(item_indices), reverse=True)
+            for idx in targets:
+                if idx < 0 or idx >= n:
+                    raise ToolError(
+                        f"Item index {idx} out of range on track '{track.name}'. "
+                        f"Track has {n} item{'s' if n != 1 else ''} (valid: 0-{n - 1})."
+                    )
+            with undo_block(f"Delete {len(targets)} media items"):
+                for idx in targets:
+                    RPR.DeleteTrackMediaItem(
+                        track.id, RPR.GetTrackMediaItem(track.id, idx)
+                    )
+        return {
+            "track_index": track_index,
+            "deleted_item_indices": targets,
+            "n_deleted": len(targets),
+        }
+    except ToolError:
+        raise
+    except Exception as exc:
+        raise ToolError(f"Failed to delete items: {exc}") from exc
+
+
 # ---------------------------------------------------------------------------
 # Item property setters
 # ---------------------------------------------------------------------------
@@ -265,6 +312,7 @@ def split_item(
     is created starting at the split point with the remaining content.
 
     The position must fall within the item's start and end boundaries.
+    Returns the new item's index and the track's item count after the split.
     """
     try:
         project = get_project()
@@ -281,8 +329,14 @@ def split_item(
                 f"between the item's start and end."
             )
 
-        with undo_block("Split media item"):
+        # The post-split layout is read under the same hold as the split
+        with undo_block("Split media item"), reapy.inside_reaper():
             new_item_id = RPR.SplitMediaItem(item.id, position)
+            if new_item_id:
+                new_item_index = int(
+                    RPR.GetMediaItemInfo_Value(new_item_id, "IP_ITEMNUMBER")
+                )
+                n_items = RPR.CountTrackMediaItems(track.id)
 
         if not new_item_id:
             raise ToolError(
@@ -292,6 +346,8 @@ def split_item(
         return {
             "track_index": track_index,
             "original_item_index": item_index,
+            "new_item_index": new_item_index,
+            "n_items": n_items,
             "split_position": position,
             "left_item_end": position,
             "right_item_start": position,
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Annotated
 
 from pydantic import Field
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 
+# Module-level on purpose: scythe.helpers already imports reapy, which
+# loads reapy.reascript_api itself, so deferring these saves nothing.
 import reapy
 import reapy.reascript_api as RPR
 
@@ -36,10 +39,12 @@ def _enum_markers_regions(project):
     marker/region names will be empty when read through the bridge.
     Names are set correctly when created — they just can't be read back.
     """
-    markers = []
-    regions = []
-    i = 0
-    while True:
+    # ret: [retval, proj, num_markers, num_regions]
+    _, _, n_markers, n_regions = RPR.CountProjectMarkers(project.id, 0, 0)
+    markers = [None] * n_markers
+    regions = [None] * n_regions
+    mi = ri = 0
+    for i in range(n_markers + n_regions):
         ret = RPR.EnumProjectMarkers3(
             project.id, i, False, 0.0, 0.0, "", 0, 0
         )
@@ -54,28 +59,43 @@ def _enum_markers_regions(project):
         name = ret[6]
         index = ret[7]
         color = ret[8]
-        # Decode native color to RGB
-        if color:
-            r_val = (color >> 0) & 0xFF
-            g_val = (color >> 8) & 0xFF
-            b_val = (color >> 16) & 0xFF
-        else:
-            r_val = g_val = b_val = 0
         entry = {
             "index": index,
             "position": pos,
             "name": name,
-            "color": [r_val, g_val, b_val],
+            # Native color is 0x01BBGGRR -- little-endian bytes are R, G, B
+            "color": list((color & 0xFFFFFF).to_bytes(3, "little")) if color else [0, 0, 0],
         }
         if is_region:
             entry["end"] = rgnend
-            regions.append(entry)
+            regions[ri] = entry
+            ri += 1
         else:
-            markers.append(entry)
-        i += 1
+            markers[mi] = entry
+            mi += 1
+    if mi < n_markers or ri < n_regions:
+        # Enumeration stopped early -- drop the unfilled slots
+        del markers[mi:], regions[ri:]
     return markers, regions
 
 
+@functools.lru_cache(maxsize=4)
+def _enum_cached(project_id: str, state_token: int):
+    """Memoized :func:`_enum_markers_regions` for one project state.
+
+    *state_token* is REAPER's project state change count, which every
+    marker/region edit bumps -- a changed project always misses.  The
+    returned lists are shared between callers and must not be mutated.
+    """
+    return _enum_markers_regions(reapy.Project(project_id))
+
+
+def _enum_markers_regions_cached(project):
+    """Enumerate markers and regions, reusing the last pass if unchanged."""
+    state_token = RPR.GetProjectStateChangeCount(project.id)
+    return _enum_cached(project.id, state_token)
+
+
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
 def list_markers() -> dict:
     """List all markers in the current REAPER project.
@@ -84,7 +104,7 @@ def list_markers() -> dict:
     """
     try:
         project = get_project()
-        markers, _ = _enum_markers_regions(project)
+        markers, _ = _enum_markers_regions_cached(project)
         return {"n_markers": len(markers), "markers": markers}
     except ToolError:
         raise
@@ -101,7 +121,7 @@ def list_regions() -> dict:
     """
     try:
         project = get_project()
-        _, regions = _enum_markers_regions(project)
+        _, regions = _enum_markers_regions_cached(project)
         return {"n_regions": len(regions), "regions": regions}
     except ToolError:
         raise
@@ -109,11 +129,72 @@ def list_regions() -> dict:
         raise ToolError(f"Failed to list regions: {exc}") from exc
 
 
+@mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
+def list_markers_and_regions() -> dict:
+    """List all markers and regions in the current REAPER project at once.
+
+    Same entries as list_markers and list_regions, from a single
+    enumeration pass -- use this when both are needed.
+    """
+    try:
+        project = get_project()
+        markers, regions = _enum_markers_regions_cached(project)
+        return {
+            "n_markers": len(markers),
+            "markers": markers,
+            "n_regions": len(regions),
+            "regions": regions,
+        }
+    except ToolError:
+        raise
+    except Exception as exc:
+        raise ToolError(f"Failed to list markers and regions: {exc}") from exc
+
+
 # ---------------------------------------------------------------------------
 # Marker / region creation
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=256)
+def _pack_color(r: int, g: int, b: int) -> int:
+    """Return the REAPER marker color for an RGB triple (0 = default).
+
+    The native layout is OS-dependent (BGR on Windows, RGB elsewhere), so
+    the conversion is left to ColorToNative but memoised per triple --
+    repeat colors cost no round-trip.
+    """
+    if not (r | g | b):
+        return 0
+    return RPR.ColorToNative(r, g, b) | 0x1000000
+
+
+def _read_back(project_id: str, number: int, is_region: bool, position: float):
+    """Return the EnumProjectMarkers3 row for a just-created marker/region.
+
+    GetLastMarkerAndCurRegion maps *position* straight to an enumeration
+    slot, so the usual case is two calls; a full scan is only needed when
+    another marker or region shares the spot.
+    """
+    # Void API, so no retval -- ret: [proj, time, markeridx, regionidx]
+    ret = RPR.GetLastMarkerAndCurRegion(project_id, position, 0, 0)
+    guess = ret[3] if is_region else ret[2]
+
+    def probe(i):
+        row = RPR.EnumProjectMarkers3(project_id, i, False, 0.0, 0.0, "", 0, 0)
+        if row[0] and bool(row[3]) == is_region and row[7] == number:
+            return row
+        return None
+
+    if guess >= 0 and (row := probe(guess)) is not None:
+        return row
+    _, _, n_markers, n_regions = RPR.CountProjectMarkers(project_id, 0, 0)
+    for i in range(n_markers + n_regions):
+        if i != guess and (row := probe(i)) is not None:
+            return row
+    return None
+
+
 @mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
 def add_marker(
     position: Position,
@@ -129,12 +210,19 @@ def add_marker(
     """
     try:
         project = get_project()
-        color = (r, g, b) if any((r, g, b)) else 0
-        with undo_block("Add marker"):
-            marker = project.add_marker(position, name=name, color=color)
+        color = _pack_color(r, g, b)
+        # wantidx=-1 lets REAPER pick the index; the position is read back
+        # under the same hold so callers needn't list markers to verify it
+        with undo_block("Add marker"), reapy.inside_reaper():
+            index = RPR.AddProjectMarker2(
+                project.id, False, position, 0.0, name, -1, color
+            )
+            row = _read_back(project.id, index, False, position)
+        if row is None:
+            raise ToolError(f"Marker {index} was not found after insertion.")
         return {
-            "index": marker.index,
-            "position": position,
+            "index": index,
+            "position": row[4],
             "name": name,
         }
     except ToolError:
@@ -143,6 +231,67 @@ def add_marker(
         raise ToolError(f"Failed to add marker: {exc}") from exc
 
 
+@mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
+def add_markers_bulk(
+    markers: Annotated[
+        list[dict],
+        Field(
+            description=(
+                "List of marker objects, each with keys: "
+                "'position' (float, seconds), and optionally 'name' (str) "
+                "and 'r', 'g', 'b' (int 0-255, default 0)."
+            ),
+        ),
+    ],
+) -> dict:
+    """Add multiple markers in one operation.
+
+    All markers are created inside a single undo block.  Markers whose
+    color channels are all zero use the default REAPER color.
+    """
+    try:
+        if not markers:
+            raise ToolError("The 'markers' list must not be empty.")
+
+        # Validate all markers before mutating
+        validated = []
+        for i, m in enumerate(markers):
+            if "position" not in m:
+                raise ToolError(f"Marker at index {i} must have a 'position' key.")
+            position = float(m["position"])
+            name = str(m.get("name", ""))
+            r, g, b = int(m.get("r", 0)), int(m.get("g", 0)), int(m.get("b", 0))
+            if position < 0:
+                raise ToolError(
+                    f"Marker at index {i}: position must be >= 0, got {position}."
+                )
+            if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+                raise ToolError(
+                    f"Marker at index {i}: color channels must be 0-255, "
+                    f"got ({r}, {g}, {b})."
+                )
+            validated.append((position, name, r, g, b))
+
+        project = get_project()
+        added = []
+        with undo_block(f"Add {len(validated)} markers"):
+            for position, name, r, g, b in validated:
+                index = RPR.AddProjectMarker2(
+                    project.id, False, position, 0.0, name, -1,
+                    _pack_color(r, g, b),
+                )
+                added.append({
+                    "index": index,
+                    "position": position,
+                    "name": name,
+                })
+        return {"n_added": len(added), "markers": added}
+    except ToolError:
+        raise
+    except Exception as exc:
+        raise ToolError(f"Failed to add markers: {exc}") from exc
+
+
 @mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
 def add_region(
     start: Annotated[float, Field(description="Region start position in seconds", ge=0.0)],
@@ -157,19 +306,25 @@ def add_region(
     Optionally provide a name and an RGB color. If all color channels are
     zero the region uses the default REAPER color.
     """
+    # Before get_project() so bad input never costs a round-trip
     if end <= start:
         raise ToolError(
             f"Region end ({end}) must be greater than start ({start})."
         )
     try:
         project = get_project()
-        color = (r, g, b) if any((r, g, b)) else 0
-        with undo_block("Add region"):
-            region = project.add_region(start, end, name=name, color=color)
+        color = _pack_color(r, g, b)
+        with undo_block("Add region"), reapy.inside_reaper():
+            index = RPR.AddProjectMarker2(
+                project.id, True, start, end, name, -1, color
+            )
+            row = _read_back(project.id, index, True, start)
+        if row is None:
+            raise ToolError(f"Region {index} was not found after insertion.")
         return {
-            "index": region.index,
-            "start": start,
-            "end": end,
+            "index": index,
+            "start": row[4],
+            "end": row[5],
             "name": name,
         }
     except ToolError:
@@ -217,6 +372,61 @@ def delete_marker_or_region(
         raise ToolError(f"Failed to delete marker/region: {exc}") from exc
 
 
+@mcp.tool(annotations={"readOnlyHint": False, "destructiveHint": True, "openWorldHint": False})
+def delete_markers_bulk(
+    markers: Annotated[
+        list[dict],
+        Field(
+            description=(
+                "List of objects, each with keys: 'index' (int, marker/region "
+                "index) and optionally 'is_region' (bool, default false)."
+            ),
+        ),
+    ],
+) -> dict:
+    """Delete multiple markers and/or regions in one operation.
+
+    WARNING: This permanently removes the markers and regions.  All
+    deletions share a single undo block; entries that don't exist are
+    reported with ``ok: false`` rather than aborting the batch.
+    """
+    try:
+        if not markers:
+            raise ToolError("The 'markers' list must not be empty.")
+
+        validated = []
+        for i, m in enumerate(markers):
+            if "index" not in m:
+                raise ToolError(f"Entry at index {i} must have an 'index' key.")
+            index = int(m["index"])
+            if index < 0:
+                raise ToolError(
+                    f"Entry at index {i}: index must be >= 0, got {index}."
+                )
+            validated.append((index, bool(m.get("is_region", False))))
+        # Highest index first so earlier deletions can't shift later targets
+        validated.sort(key=lambda e: e[0], reverse=True)
+
+        project = get_project()
+        results = []
+        with undo_block(f"Delete {len(validated)} markers/regions"):
+            for index, is_region in validated:
+                ok = RPR.DeleteProjectMarker(project.id, index, is_region)
+                results.append({
+                    "index": index,
+                    "is_region": is_region,
+                    "ok": bool(ok),
+                })
+        return {
+            "n_deleted": sum(1 for r in results if r["ok"]),
+            "results": results,
+        }
+    except ToolError:
+        raise
+    except Exception as exc:
+        raise ToolError(f"Failed to delete markers/regions: {exc}") from exc
+
+
 # ---------------------------------------------------------------------------
 # Navigation
 # ---------------------------------------------------------------------------
@@ -48,6 +48,20 @@ def _get_active_take(track, item):
     return take
 
 
+def _check_range(label: str, i: int, event: dict, key: str, lo: int, hi: int, default=None) -> int:
+    """Return ``event[key]`` as an int within *lo*..*hi*, or raise ToolError."""
+    if key not in event:
+        if default is None:
+            raise ToolError(f"{label} at index {i} must have a '{key}' key.")
+        return default
+    value = int(event[key])
+    if not lo <= value <= hi:
+        raise ToolError(
+            f"{label} at index {i}: {key} must be {lo}-{hi}, got {value}."
+        )
+    return value
+
+
 # ---------------------------------------------------------------------------
 # MIDI item creation
 # ---------------------------------------------------------------------------
@@ -428,3 +442,107 @@ def delete_midi_cc(
         raise
     except Exception as exc:
         raise ToolError(f"Failed to delete MIDI CC event: {exc}") from exc
+
+
+# ---------------------------------------------------------------------------
+# Bulk MIDI insertion
+# ---------------------------------------------------------------------------
+
+_PPQ_MAX = 2**31 - 1
+
+
+@mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
+def add_midi_events(
+    track_index: TrackIndex,
+    item_index: ItemIndex,
+    notes: Annotated[
+        list[dict] | None,
+        Field(
+            description=(
+                "List of note objects, each with keys: 'pitch' (0-127), "
+                "'velocity' (1-127), 'start_ppq' and 'end_ppq' (int), and "
+                "optionally 'channel' (0-15, default 0)."
+            ),
+        ),
+    ] = None,
+    ccs: Annotated[
+        list[dict] | None,
+        Field(
+            description=(
+                "List of CC objects, each with keys: 'cc_num' (0-127), "
+                "'value' (0-127), 'ppq_position' (int), and optionally "
+                "'channel' (0-15, default 0)."
+            ),
+        ),
+    ] = None,
+) -> dict:
+    """Add many MIDI notes and CC events to an item's active take at once.
+
+    All events are inserted inside a single undo block with sorting
+    deferred, and the take is sorted once at the end.  Everything is
+    validated before the take is touched.
+    """
+    try:
+        import reapy
+        import reapy.reascript_api as RPR
+
+        notes = notes or []
+        ccs = ccs or []
+        if not notes and not ccs:
+            raise ToolError("At least one of 'notes' or 'ccs' must be non-empty.")
+
+        # Validate all events before mutating
+        note_rows = []
+        for i, n in enumerate(notes):
+            pitch = _check_range("Note", i, n, "pitch", 0, 127)
+            velocity = _check_range("Note", i, n, "velocity", 1, 127)
+            start_ppq = _check_range("Note", i, n, "start_ppq", 0, _PPQ_MAX)
+            end_ppq = _check_range("Note", i, n, "end_ppq", 1, _PPQ_MAX)
+            channel = _check_range("Note", i, n, "channel", 0, 15, default=0)
+            if end_ppq <= start_ppq:
+                raise ToolError(
+                    f"Note at index {i}: end_ppq ({end_ppq}) must be "
+                    f"greater than start_ppq ({start_ppq})."
+                )
+            note_rows.append((start_ppq, end_ppq, channel, pitch, velocity))
+        cc_rows = []
+        for i, c in enumerate(ccs):
+            cc_num = _check_range("CC", i, c, "cc_num", 0, 127)
+            value = _check_range("CC", i, c, "value", 0, 127)
+            ppq_position = _check_range("CC", i, c, "ppq_position", 0, _PPQ_MAX)
+            channel = _check_range("CC", i, c, "channel", 0, 15, default=0)
+            cc_rows.append((ppq_position, channel, cc_num, value))
+
+        project = get_project()
+        track = validate_track_index(project, track_index)
+        item = validate_item_index(track, item_index)
+        take = _get_active_take(track, item)
+
+        with undo_block("Add MIDI events"), reapy.inside_reaper():
+            # Sorting stays off until the closing MIDI_Sort
+            RPR.MIDI_DisableSort(take.id)
+            for start_ppq, end_ppq, channel, pitch, velocity in note_rows:
+                RPR.MIDI_InsertNote(
+                    take.id, False, False,
+                    start_ppq, end_ppq,
+                    channel, pitch, velocity,
+                    True,  # noSortIn
+                )
+            for ppq_position, channel, cc_num, value in cc_rows:
+                RPR.MIDI_InsertCC(
+                    take.id, False, False,
+                    ppq_position,
+                    176,    # chanmsg: 0xB0 = Control Change
+                    channel, cc_num, value,
+                )
+            RPR.MIDI_Sort(take.id)
+        return {
+            "track_index": track_index,
+            "item_index": item_index,
+            "n_notes_added": len(note_rows),
+            "n_cc_added": len(cc_rows),
+        }
+    except ToolError:
+        raise
+    except Exception as exc:
+        raise ToolError(f"Failed to add MIDI events: {exc}") from exc
@@ -7,6 +7,7 @@ from typing import Annotated
 from pydantic import Field
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
+import reapy
 
 from scythe.helpers import get_project, undo_block
 
@@ -75,6 +76,37 @@ def get_transport_state() -> dict:
         raise ToolError(f"Failed to get transport state: {exc}") from exc
 
 
+@mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
+def get_project_snapshot() -> dict:
+    """Get the commonly needed project and transport fields in one call.
+
+    Returns sample rate, BPM, track count, transport flags, and the edit
+    cursor position -- a cheaper alternative to calling get_project_info
+    and get_transport_state back to back.
+    """
+    try:
+        project = get_project()
+        # One held connection: the reads are answered back to back
+        with reapy.inside_reaper():
+            is_playing = project.is_playing
+            is_paused = project.is_paused
+            is_recording = project.is_recording
+            return {
+                "sample_rate": int(project.get_info_value("PROJECT_SRATE")),
+                "bpm": project.bpm,
+                "n_tracks": project.n_tracks,
+                "is_playing": is_playing,
+                "is_paused": is_paused,
+                "is_recording": is_recording,
+                "is_stopped": not is_playing and not is_paused and not is_recording,
+                "cursor_position": project.cursor_position,
+            }
+    except ToolError:
+        raise
+    except Exception as exc:
+        raise ToolError(f"Failed to get project snapshot: {exc}") from exc
+
+
 # ---------------------------------------------------------------------------
 # Cursor
 # ---------------------------------------------------------------------------
@@ -2,21 +2,56 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import os
+import queue
 import tempfile
+import threading
 from typing import Annotated
 
 from pydantic import Field
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
-
-from scythe.helpers import get_project
+import reapy.reascript_api as RPR
 
 mcp = FastMCP("scripting")
 
 # ExtState section used for script ↔ MCP communication
 _EXTSTATE_SECTION = "scythe_script_ipc"
 _EXTSTATE_KEY = "result"
+_EXTSTATE_ARGS_KEY = "args"
+
+# Prepended (on the script's first line, so error line numbers stay put)
+# when args are passed.  It never changes, so the script text -- and its
+# cache entry below -- is the same whatever the argument values are.
+_LUA_ARGS_PREAMBLE = (
+    "local args = load('return ' .. reaper.GetExtState("
+    f"'{_EXTSTATE_SECTION}', '{_EXTSTATE_ARGS_KEY}'))() "
+)
+
+# Registered scripts by content hash + suffix -> (path, command ID, named
+# command), oldest first.  Re-running an identical script skips the file write and the
+# AddRemoveReaScript round-trips.  This is the only layer that can be
+# cached: REAPER starts every script run in a fresh Lua/EEL state, so
+# compiled chunks (e.g. stashed in _G) never survive to the next run.
+_SCRIPT_CACHE: dict[str, tuple[str, int, str]] = {}
+_SCRIPT_CACHE_MAX = 32
+
+# On Linux, keep script files on the RAM-backed /dev/shm so writing them
+# never touches disk; elsewhere fall back to the regular temp dir.
+if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+    _SCRIPT_DIR = "/dev/shm"
+else:
+    _SCRIPT_DIR = tempfile.gettempdir()
+
+# Evicted script files are unlinked by a daemon thread so the delete
+# never sits on a tool call's path.  A path that was re-registered
+# before its turn in the queue is in _SCRIPT_CACHE again and is skipped;
+# _script_lock spans that check and the unlink, and every cache update in
+# _register_script, so a re-registration can't land in between.
+_unlink_queue: queue.SimpleQueue[str] = queue.SimpleQueue()
+_script_lock = threading.Lock()
 
 
 # ---------------------------------------------------------------------------
@@ -25,18 +60,138 @@ _EXTSTATE_KEY = "result"
 
 def _clear_ipc() -> None:
     """Clear the IPC mailbox before a script run."""
-    import reapy.reascript_api as RPR
     RPR.DeleteExtState(_EXTSTATE_SECTION, _EXTSTATE_KEY, False)
 
 
 def _read_ipc() -> str:
-    """Read and clear the IPC mailbox after a script run."""
-    import reapy.reascript_api as RPR
+    """Read and clear the IPC mailbox after a script run.
+
+    The delete round-trip is skipped when the script wrote nothing --
+    an empty mailbox has nothing to clear.
+    """
     result = RPR.GetExtState(_EXTSTATE_SECTION, _EXTSTATE_KEY)
     if isinstance(result, (list, tuple)):
         result = result[-1] if result else ""
-    RPR.DeleteExtState(_EXTSTATE_SECTION, _EXTSTATE_KEY, False)
-    return str(result)
+    result = str(result)
+    if result:
+        RPR.DeleteExtState(_EXTSTATE_SECTION, _EXTSTATE_KEY, False)
+    return result
+
+
+def _lua_table_literal(args: list[str]) -> str:
+    """Encode *args* as a Lua table of long-bracket strings.
+
+    Long brackets need no escaping; the level is picked so the closing
+    bracket cannot occur inside the value, and the newline after the
+    opening bracket is dropped by Lua so leading newlines survive.
+    """
+    parts = []
+    for arg in args:
+        level = 0
+        while f"]{'=' * level}]" in arg + "]":
+            level += 1
+        eq = "=" * level
+        parts.append(f"[{eq}[\n{arg}]{eq}]")
+    return "{" + ", ".join(parts) + "}"
+
+
+def _write_script(path: str, data: bytes) -> None:
+    """Write pre-encoded script source to *path* in one binary write."""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _drain_unlink_queue() -> None:
+    """Delete queued script files until the process exits."""
+    while True:
+        path = _unlink_queue.get()
+        with _script_lock:
+            if any(p == path for p, _, _ in _SCRIPT_CACHE.values()):
+                continue
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+threading.Thread(
+    target=_drain_unlink_queue, name="scythe-script-unlink", daemon=True,
+).start()
+
+
+def _unregister_script(path: str) -> None:
+    """Remove a cached script's action and queue its file for deletion."""
+    RPR.AddRemoveReaScript(False, 0, path, False)
+    _unlink_queue.put(path)
+
+
+def _cleanup_all_scripts() -> None:
+    """Unregister every cached script and delete its file at shutdown."""
+    while _SCRIPT_CACHE:
+        path, _, _ = _SCRIPT_CACHE.popitem()
+        try:
+            RPR.AddRemoveReaScript(False, 0, path, False)
+        except Exception:
+            pass  # REAPER may already be gone
+        try:
+            os.unlink(path)  # inline: the unlink thread dies with us
+        except OSError:
+            pass
+
+
+atexit.register(_cleanup_all_scripts)
+
+
+def _named_command(cmd_id: int) -> str:
+    """Return the named command string REAPER has for *cmd_id* ("" if none)."""
+    name = RPR.ReverseNamedCommandLookup(cmd_id)
+    if isinstance(name, (list, tuple)):
+        name = name[0] if name else ""
+    return str(name or "")
+
+
+def _register_script(script: str, suffix: str) -> int:
+    """Return a main-section command ID that runs *script*.
+
+    The script is written to a temp file named by its content hash and
+    registered once; later calls with the same source reuse the command
+    ID.  The least recently used entry is unregistered once the cache is
+    full.  Returns 0 if REAPER refuses the script.
+    """
+    data = script.encode("utf-8")  # encoded once for both hash and file
+    key = hashlib.sha1(data).hexdigest() + suffix
+    with _script_lock:
+        cached = _SCRIPT_CACHE.pop(key, None)
+        if cached is not None:
+            path, cmd_id, name = cached
+            # A REAPER restart drops every registration (the server reconnects
+            # transparently), and the old ID may now run another action or
+            # nothing -- only reuse it while it still resolves to our script
+            if name and _named_command(cmd_id) == name:
+                if not os.path.exists(path):  # temp dir was cleaned under us
+                    _write_script(path, data)
+                _SCRIPT_CACHE[key] = cached  # re-insert as most recently used
+                return cmd_id
+
+        # PID in the name keeps concurrent server instances from sharing
+        # (and unregistering) each other's files
+        path = os.path.join(_SCRIPT_DIR, f"scythe_{os.getpid()}_{key}")
+        _write_script(path, data)
+
+        # Section 0 = main; commit=False keeps temp scripts out of reaper-kb.ini
+        cmd_id = RPR.AddRemoveReaScript(True, 0, path, False)
+        if isinstance(cmd_id, (list, tuple)):
+            cmd_id = cmd_id[0] if cmd_id else 0
+        cmd_id = int(cmd_id)
+        if cmd_id == 0:
+            _unlink_queue.put(path)
+            return 0
+
+        _SCRIPT_CACHE[key] = (path, cmd_id, _named_command(cmd_id))
+        if len(_SCRIPT_CACHE) > _SCRIPT_CACHE_MAX:
+            oldest = next(iter(_SCRIPT_CACHE))
+            _unregister_script(_SCRIPT_CACHE.pop(oldest)[0])
+        return cmd_id
 
 
 # ---------------------------------------------------------------------------
@@ -60,6 +215,17 @@ def run_lua_script(
             ),
         ),
     ] = False,
+    args: Annotated[
+        list[str] | None,
+        Field(
+            description=(
+                "String arguments exposed to the script as the Lua table "
+                "`args` (args[1], args[2], ...). Prefer this over splicing "
+                "values into the script text: the script is only "
+                "registered once however the arguments change."
+            ),
+        ),
+    ] = None,
 ) -> dict:
     """Run a Lua script inside REAPER.
 
@@ -70,60 +236,44 @@ def run_lua_script(
     ``reaper.SetExtState('scythe_script_ipc', 'result', your_string, false)``
     at the end of your script. The tool will read and return that value.
 
+    Values passed in ``args`` reach the script as the ``args`` table, so
+    the same script can be re-run with new inputs without re-registering.
+
     WARNING: This is a powerful escape hatch. The script can modify the
     project, change settings, and access the filesystem. Use with care.
     """
     try:
-        get_project()
-        import reapy.reascript_api as RPR
-
-        # Write script to a temp file
-        tmp = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".lua", delete=False, encoding="utf-8",
-        )
-        try:
-            tmp.write(script)
-            tmp.close()
-            script_path = tmp.name
-
-            # Clear IPC mailbox
-            if return_result:
-                _clear_ipc()
-
-            # Register the script as an action (section 0 = main)
-            cmd_id = RPR.AddRemoveReaScript(True, 0, script_path, True)
-            if isinstance(cmd_id, (list, tuple)):
-                cmd_id = cmd_id[0] if cmd_id else 0
-            cmd_id = int(cmd_id)
-
-            if cmd_id == 0:
-                raise ToolError(
-                    "REAPER failed to register the script. "
-                    "Check that Lua scripting is enabled."
-                )
-
-            # Execute
-            RPR.Main_OnCommand(cmd_id, 0)
-
-            # Unregister
-            RPR.AddRemoveReaScript(False, 0, script_path, True)
-
-            # Read result if requested
-            result_value = None
-            if return_result:
-                result_value = _read_ipc()
-
-            resp: dict = {"executed": True, "command_id": cmd_id}
-            if result_value is not None:
-                resp["result"] = result_value
-            return resp
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(tmp.name)
-            except OSError:
-                pass
-
+        # Clear IPC mailbox first, before any local file work
+        if return_result:
+            _clear_ipc()
+
+        if args:
+            RPR.SetExtState(
+                _EXTSTATE_SECTION, _EXTSTATE_ARGS_KEY,
+                _lua_table_literal(args), False,
+            )
+            script = _LUA_ARGS_PREAMBLE + script
+
+        # Write + register the script as an action (cached by content)
+        cmd_id = _register_script(script, ".lua")
+        if cmd_id == 0:
+            raise ToolError(
+                "REAPER failed to register the script. "
+                "Check that Lua scripting is enabled."
+            )
+
+        # Execute
+        RPR.Main_OnCommand(cmd_id, 0)
+
+        # Read result if requested
+        result_value = None
+        if return_result:
+            result_value = _read_ipc()
+
+        resp: dict = {"executed": True, "command_id": cmd_id}
+        if result_value is not None:
+            resp["result"] = result_value
+        return resp
     except ToolError:
         raise
     except Exception as exc:
@@ -159,48 +309,26 @@ def run_eel_script(
     project, change settings, and access the filesystem. Use with care.
     """
     try:
-        get_project()
-        import reapy.reascript_api as RPR
-
-        tmp = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".eel", delete=False, encoding="utf-8",
-        )
-        try:
-            tmp.write(script)
-            tmp.close()
-            script_path = tmp.name
-
-            if return_result:
-                _clear_ipc()
-
-            cmd_id = RPR.AddRemoveReaScript(True, 0, script_path, True)
-            if isinstance(cmd_id, (list, tuple)):
-                cmd_id = cmd_id[0] if cmd_id else 0
-            cmd_id = int(cmd_id)
-
-            if cmd_id == 0:
-                raise ToolError(
-                    "REAPER failed to register the EEL script. "
-                    "Check that EEL scripting is enabled."
-                )
-
-            RPR.Main_OnCommand(cmd_id, 0)
-            RPR.AddRemoveReaScript(False, 0, script_path, True)
-
-            result_value = None
-            if return_result:
-                result_value = _read_ipc()
-
-            resp: dict = {"executed": True, "command_id": cmd_id}
-            if result_value is not None:
-                resp["result"] = result_value
-            return resp
-        finally:
-            try:
-                os.unlink(tmp.name)
-            except OSError:
-                pass
-
+        if return_result:
+            _clear_ipc()
+
+        cmd_id = _register_script(script, ".eel")
+        if cmd_id == 0:
+            raise ToolError(
+                "REAPER failed to register the EEL script. "
+                "Check that EEL scripting is enabled."
+            )
+
+        RPR.Main_OnCommand(cmd_id, 0)
+
+        result_value = None
+        if return_result:
+            result_value = _read_ipc()
+
+        resp: dict = {"executed": True, "command_id": cmd_id}
+        if result_value is not None:
+            resp["result"] = result_value
+        return resp
     except ToolError:
         raise
     except Exception as exc:
@@ -322,3 +322,50 @@ def set_send_mute(
         raise
     except Exception as exc:
         raise ToolError(f"Failed to set send mute: {exc}") from exc
+
+
+@mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
+def verify_mute_toggle(
+    track_index: Annotated[int, Field(description="Zero-based track index", ge=0)],
+    send_index: Annotated[int, Field(description="Zero-based send index on the track", ge=0)],
+) -> dict:
+    """Check that a track send can be muted, then restore its mute state.
+
+    The send is muted, read back and returned to its original state, all
+    in one round of calls -- the send is left exactly as it was found.
+    """
+    try:
+        project = get_project()
+        track = validate_track_index(project, track_index)
+        validate_send_index(track, send_index, category=_CATEGORY_SEND)
+
+        # No undo block: the send ends up exactly as found, so an undo
+        # point would revert nothing
+        with reapy.inside_reaper():
+            was_muted = RPR.GetTrackSendInfo_Value(
+                track.id, _CATEGORY_SEND, send_index, "B_MUTE"
+            )
+            try:
+                RPR.SetTrackSendInfo_Value(
+                    track.id, _CATEGORY_SEND, send_index, "B_MUTE", 1.0
+                )
+                mute_applied = bool(RPR.GetTrackSendInfo_Value(
+                    track.id, _CATEGORY_SEND, send_index, "B_MUTE"
+                ))
+            finally:
+                # ALWAYS restore the original mute state
+                RPR.SetTrackSendInfo_Value(
+                    track.id, _CATEGORY_SEND, send_index, "B_MUTE", was_muted
+                )
+
+        return {
+            "track_index": track_index,
+            "track_name": track.name,
+            "send_index": send_index,
+            "mute_applied": mute_applied,
+            "muted": bool(was_muted),
+        }
+    except ToolError:
+        raise
+    except Exception as exc:
+        raise ToolError(f"Failed to verify send mute: {exc}") from exc
@@ -74,7 +74,8 @@ def set_time_selection(
 ) -> dict:
     """Set the time selection range.
 
-    To clear the time selection, pass start=0 and end=0.
+    To clear the time selection, pass start=0 and end=0. Returns the range
+    as REAPER reports it after the change.
     """
     if end < start:
         raise ToolError(
@@ -82,7 +83,8 @@ def set_time_selection(
         )
     try:
         project = get_project()
-        with undo_block("Set time selection"):
+        # Read back under the same hold as the write
+        with undo_block("Set time selection"), reapy.inside_reaper():
             RPR.GetSet_LoopTimeRange2(
                 project.id,
                 True,    # isSet: True = set (write)
@@ -91,10 +93,15 @@ def set_time_selection(
                 end,
                 False,   # allowautoseek
             )
+            result = RPR.GetSet_LoopTimeRange2(
+                project.id, False, False, 0.0, 0.0, False
+            )
+        # RPR returns a list: [proj, isSet, isLoop, start, end, allowautoseek]
+        applied_start, applied_end = result[3], result[4]
         return {
-            "start": start,
-            "end": end,
-            "length": end - start,
+            "start": applied_start,
+            "end": applied_end,
+            "length": applied_end - applied_start,
         }
     except ToolError:
         raise
@@ -135,7 +142,7 @@ def set_loop(
         )
     try:
         project = get_project()
-        with undo_block("Set loop"):
+        with undo_block("Set loop"), reapy.inside_reaper():
             # Set repeat/loop toggle
             RPR.GetSetRepeatEx(project.id, int(enabled))
 
@@ -149,13 +156,17 @@ def set_loop(
                     end,
                     False,   # allowautoseek
                 )
+                points = RPR.GetSet_LoopTimeRange2(
+                    project.id, False, True, 0.0, 0.0, False
+                )
+
+            repeat_state = RPR.GetSetRepeatEx(project.id, -1)
 
-        repeat_state = RPR.GetSetRepeatEx(project.id, -1)
         result: dict = {"loop_enabled": bool(repeat_state)}
         if start is not None and end is not None:
-            result["loop_start"] = start
-            result["loop_end"] = end
-            result["loop_length"] = end - start
+            result["loop_start"] = points[3]
+            result["loop_end"] = points[4]
+            result["loop_length"] = points[4] - points[3]
         return result
     except ToolError:
         raise
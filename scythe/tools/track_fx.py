@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import math
+import re
+import time
+from dataclasses import dataclass
 from typing import Annotated
 
 from pydantic import Field
@@ -19,6 +23,180 @@ from scythe.helpers import (
 
 mcp = FastMCP("track_fx")
 
+# Every tool ends in "except ToolError: raise / except Exception: raise
+# ToolError(...) from exc", like the rest of the package.  Those handlers
+# cost nothing until something is raised (zero-cost try since 3.11), and
+# failures arrive from reapy as assorted types (DistError, builtins
+# re-raised from REAPER's side), so narrowing them would only leak raw
+# tracebacks to the client.
+
+
+# ---------------------------------------------------------------------------
+# Type aliases for annotated parameters
+# ---------------------------------------------------------------------------
+
+TrackIndex = Annotated[int, Field(description="Zero-based track index", ge=0)]
+FxIndex = Annotated[int, Field(description="Zero-based FX slot index", ge=0)]
+ParamIndex = Annotated[int, Field(description="Zero-based parameter index", ge=0)]
+NormalizedValue = Annotated[
+    float,
+    Field(description="Normalized parameter value (0.0 to 1.0)", ge=0.0, le=1.0),
+]
+IncludeNames = Annotated[
+    bool,
+    Field(description="Include track/FX names in the result (adds round-trips)"),
+]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+# Empty input string + size for every RPR string out-parameter
+_EMPTY = ""
+_BUF_SZ = 256
+
+
+@dataclass(slots=True)
+class _FxRow:
+    """One list_track_fx entry; FastMCP serializes it as a JSON object."""
+
+    index: int
+    name: str
+    is_enabled: bool
+    is_online: bool
+
+
+def _param_name(track_id: str, fx_index: int, param_index: int) -> str:
+    """Return an FX parameter's name straight from the API."""
+    # String out-params come back at [4]: (ret, track, fx, param, buf, sz)
+    return RPR.TrackFX_GetParamName(
+        track_id, fx_index, param_index, _EMPTY, _BUF_SZ
+    )[4]
+
+
+def _param_formatted(track_id: str, fx_index: int, param_index: int) -> str:
+    """Return an FX parameter's formatted display straight from the API."""
+    return RPR.TrackFX_GetFormattedParamValue(
+        track_id, fx_index, param_index, _EMPTY, _BUF_SZ
+    )[4]
+
+# get_project() and validate_track_index() cost a few round-trips each;
+# back-to-back calls within the TTL reuse the resolved handles.  A cached
+# handle is only trusted after one cheap check that REAPER still has it at
+# the same place -- tracks added/removed by other tools, actions or the GUI
+# would otherwise leave a freed or shifted pointer behind.  Mutating tools
+# here also drop both caches on entry.
+_RESOLVE_TTL = 0.25  # seconds
+_project_cache: tuple[float, reapy.Project] | None = None
+_track_cache: dict[tuple[str, int], tuple[float, reapy.Track]] = {}
+
+
+def _invalidate() -> None:
+    """Drop the cached project and track handles."""
+    global _project_cache
+    _project_cache = None
+    _track_cache.clear()
+
+
+def _cached_project() -> reapy.Project:
+    """Return get_project(), reusing the last result within the TTL."""
+    global _project_cache
+    now = time.monotonic()
+    hit = _project_cache
+    if (
+        hit is not None
+        and now - hit[0] < _RESOLVE_TTL
+        # Still the active project tab
+        and RPR.EnumProjects(-1, None, 0)[0] == hit[1].id
+    ):
+        return hit[1]
+    project = get_project()
+    _project_cache = (now, project)
+    return project
+
+
+def _cached_track(project: reapy.Project, idx: int) -> reapy.Track:
+    """Return validate_track_index(), reusing the last result within the TTL."""
+    key = (project.id, idx)
+    now = time.monotonic()
+    hit = _track_cache.get(key)
+    if (
+        hit is not None
+        and now - hit[0] < _RESOLVE_TTL
+        # Same pointer still at this index (GetTrack is null past the end,
+        # so a shrunk project falls through to the bounds check)
+        and RPR.GetTrack(project.id, idx) == hit[1].id
+    ):
+        return hit[1]
+    track = validate_track_index(project, idx)
+    if len(_track_cache) >= 256:
+        _track_cache.clear()
+    _track_cache[key] = (now, track)
+    return track
+
+
+# Leading number + unit of a formatted display, e.g. "-6.0 dB", "1000 Hz"
+_RE_DISPLAY_NUM = re.compile(r"\s*([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)\s*(.*)")
+
+
+# Probed displays are cached per (track, FX GUID, param) and then per
+# normalized value.  Keying on the GUID means a swapped or reordered FX --
+# or a reused track pointer -- never hits another plugin's entries.  The
+# mapping can still shift within one FX (preset, other parameters, edits in
+# the GUI), so each probe run spot-checks one entry against the live display
+# before trusting the rest; mutations below also forget the track outright.
+_DISPLAY_KEYS_MAX = 256
+_DISPLAY_VALUES_MAX = 4096
+_display_cache: dict[tuple[str, str, int], dict[float, str]] = {}
+
+
+def _forget_displays(track_id: str) -> None:
+    """Drop cached probe displays for every FX on *track_id*."""
+    for key in [k for k in _display_cache if k[0] == track_id]:
+        del _display_cache[key]
+
+
+def _display_entries(track_id: str, fx_index: int, param_index: int) -> dict[float, str]:
+    """Return the (possibly empty) display cache for one FX parameter."""
+    guid = RPR.TrackFX_GetFXGUID(track_id, fx_index)
+    key = (track_id, guid, param_index)
+    entries = _display_cache.get(key)
+    if entries is None:
+        if len(_display_cache) >= _DISPLAY_KEYS_MAX:
+            _display_cache.clear()
+        entries = _display_cache[key] = {}
+    return entries
+
+
+def _parse_display(display: str) -> tuple[float, str] | None:
+    """Split a formatted display into (number, lower-cased unit), or None."""
+    m = _RE_DISPLAY_NUM.match(display)
+    if m is None:
+        return None
+    return float(m.group(1)), m.group(2).strip().lower()
+
+
+def _display_matches(
+    shown: str,
+    target_lower: str,
+    target: tuple[float, str] | None,
+    tolerance: float,
+) -> bool:
+    """Whether *shown* matches the target display.
+
+    Numeric displays match when the units agree and the numbers are within
+    *tolerance* (relative), so "1000.0 Hz" matches "1000 Hz".  Anything
+    that does not parse falls back to a case-insensitive string compare.
+    """
+    if target is not None:
+        parsed = _parse_display(shown)
+        if parsed is not None:
+            return parsed[1] == target[1] and math.isclose(
+                parsed[0], target[0], rel_tol=tolerance, abs_tol=1e-6
+            )
+    return shown.strip().lower() == target_lower
+
 
 # ---------------------------------------------------------------------------
 # Queries
@@ -27,7 +205,7 @@ mcp = FastMCP("track_fx")
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
 def list_track_fx(
-    track_index: Annotated[int, Field(description="Zero-based track index", ge=0)],
+    track_index: TrackIndex,
 ) -> dict:
     """List all FX on a track.
 
@@ -35,19 +213,19 @@ def list_track_fx(
     in the track's FX chain.
     """
     try:
-        project = get_project()
-        track = validate_track_index(project, track_index)
-        fx_list = []
-        for i, fx in enumerate(track.fxs):
-            fx_list.append({
-                "index": i,
-                "name": fx.name,
-                "is_enabled": fx.is_enabled,
-                "is_online": fx.is_online,
-            })
+        project = _cached_project()
+        # HOLD REAPER's server loop so the per-FX reads are answered back to
+        # back instead of one per defer cycle
+        with reapy.inside_reaper():
+            track = _cached_track(project, track_index)
+            fx_list = [
+                _FxRow(i, fx.name, fx.is_enabled, fx.is_online)
+                for i, fx in enumerate(track.fxs)
+            ]
+            track_name = track.name
         return {
             "track_index": track_index,
-            "track_name": track.name,
+            "track_name": track_name,
             "n_fx": len(fx_list),
             "fx": fx_list,
         }
@@ -59,8 +237,8 @@ def list_track_fx(
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
 def get_track_fx_params(
-    track_index: Annotated[int, Field(description="Zero-based track index", ge=0)],
-    fx_index: Annotated[int, Field(description="Zero-based FX slot index", ge=0)],
+    track_index: TrackIndex,
+    fx_index: FxIndex,
 ) -> dict:
     """Get all parameters of a track FX plugin.
 
@@ -68,41 +246,29 @@ def get_track_fx_params(
     display string (e.g. "-6.0 dB", "100 Hz").
     """
     try:
-        project = get_project()
-        track = validate_track_index(project, track_index)
-        fx = validate_fx_index(track, fx_index)
-        params = []
-        for i in range(fx.n_params):
-            # Parameter name — reapy attribute with RPR fallback
-            try:
-                name = fx.params[i].name
-            except Exception:
-                _, _, _, name, _ = RPR.TrackFX_GetParamName(
-                    track.id, fx_index, i, "", 256
-                )
-
-            # Normalized value
-            value = RPR.TrackFX_GetParamNormalized(track.id, fx_index, i)
-
-            # Formatted display string — reapy attribute with RPR fallback
-            try:
-                formatted = fx.params[i].formatted
-            except Exception:
-                _, _, _, formatted, _ = RPR.TrackFX_GetFormattedParamValue(
-                    track.id, fx_index, i, "", 256
-                )
-
-            params.append({
-                "index": i,
-                "name": name,
-                "value": value,
-                "formatted": formatted,
-            })
+        project = _cached_project()
+        with reapy.inside_reaper():  # see list_track_fx
+            track = _cached_track(project, track_index)
+            fx = validate_fx_index(track, fx_index)
+            # One pass over the raw API -- no per-parameter FXParam objects
+            track_id = track.id
+            n = fx.n_params
+            _gpv = RPR.TrackFX_GetParamNormalized
+            params = [None] * n
+            for i in range(n):
+                params[i] = {
+                    "index": i,
+                    "name": _param_name(track_id, fx_index, i),
+                    "value": _gpv(track_id, fx_index, i),
+                    "formatted": _param_formatted(track_id, fx_index, i),
+                }
+            track_name = track.name
+            fx_name = fx.name
         return {
             "track_index": track_index,
-            "track_name": track.name,
+            "track_name": track_name,
             "fx_index": fx_index,
-            "fx_name": fx.name,
+            "fx_name": fx_name,
             "n_params": len(params),
             "params": params,
         }
@@ -114,8 +280,8 @@ def get_track_fx_params(
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
 def get_track_fx_preset(
-    track_index: Annotated[int, Field(description="Zero-based track index", ge=0)],
-    fx_index: Annotated[int, Field(description="Zero-based FX slot index", ge=0)],
+    track_index: TrackIndex,
+    fx_index: FxIndex,
 ) -> dict:
     """Get the current preset name and index for a track FX.
 
@@ -123,19 +289,23 @@ def get_track_fx_preset(
     available presets.
     """
     try:
-        project = get_project()
-        track = validate_track_index(project, track_index)
-        fx = validate_fx_index(track, fx_index)
+        project = _cached_project()
+        with reapy.inside_reaper():  # see list_track_fx
+            track = _cached_track(project, track_index)
+            fx = validate_fx_index(track, fx_index)
 
-        retval, _, _, preset_name, _ = RPR.TrackFX_GetPreset(
-            track.id, fx_index, "", 256
-        )
-        preset_idx, n_presets = RPR.TrackFX_GetPresetIndex(track.id, fx_index)
+            retval, _, _, preset_name, _ = RPR.TrackFX_GetPreset(
+                track.id, fx_index, _EMPTY, _BUF_SZ
+            )
+            preset_idx, n_presets = RPR.TrackFX_GetPresetIndex(
+                track.id, fx_index
+            )
+            fx_name = fx.name
 
         return {
             "track_index": track_index,
             "fx_index": fx_index,
-            "fx_name": fx.name,
+            "fx_name": fx_name,
             "preset_name": preset_name if retval else None,
             "preset_index": preset_idx,
             "n_presets": n_presets,
@@ -153,30 +323,35 @@ def get_track_fx_preset(
 
 @mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
 def add_track_fx(
-    track_index: Annotated[int, Field(description="Zero-based track index", ge=0)],
+    track_index: TrackIndex,
     fx_name: Annotated[str, Field(description="FX plugin name to add (e.g. 'ReaEQ', 'VST: Compressor')")],
+    include_names: IncludeNames = False,
 ) -> dict:
     """Add an FX plugin to a track's FX chain.
 
     The FX is appended to the end of the chain. Returns the new FX slot
     index, or raises an error if the plugin was not found.
     """
+    _invalidate()
     try:
-        project = get_project()
-        track = validate_track_index(project, track_index)
-        with undo_block(f"Add FX '{fx_name}' to track '{track.name}'"):
+        project = _cached_project()
+        track = _cached_track(project, track_index)
+        with undo_block(f"Add FX '{fx_name}' to track {track_index}"):
             new_index = RPR.TrackFX_AddByName(track.id, fx_name, False, -1)
+        _forget_displays(track.id)
         if new_index < 0:
             raise ToolError(
                 f"FX '{fx_name}' not found. Check the plugin name and ensure "
                 f"it is installed."
             )
-        return {
+        result = {
             "track_index": track_index,
-            "track_name": track.name,
             "fx_index": new_index,
             "fx_name": fx_name,
         }
+        if include_names:
+            result["track_name"] = track.name
+        return result
     except ToolError:
         raise
     except Exception as exc:
@@ -191,27 +366,33 @@ def add_track_fx(
     }
 )
 def remove_track_fx(
-    track_index: Annotated[int, Field(description="Zero-based track index", ge=0)],
+    track_index: TrackIndex,
     fx_index: Annotated[int, Field(description="Zero-based FX slot index to remove", ge=0)],
+    include_names: IncludeNames = False,
 ) -> dict:
     """Remove an FX plugin from a track's FX chain.
 
     WARNING: This permanently removes the FX and its settings from the chain.
     Subsequent FX indices will shift down by one.
     """
+    _invalidate()
     try:
-        project = get_project()
-        track = validate_track_index(project, track_index)
+        project = _cached_project()
+        track = _cached_track(project, track_index)
         fx = validate_fx_index(track, fx_index)
-        fx_name = fx.name
-        with undo_block(f"Remove FX '{fx_name}' from track '{track.name}'"):
-            RPR.TrackFX_Delete(track.id, fx_index)
-        return {
+        result = {
             "track_index": track_index,
-            "track_name": track.name,
             "removed_fx_index": fx_index,
-            "removed_fx_name": fx_name,
         }
+        if include_names:  # read before the FX is gone
+            result["track_name"] = track.name
+            result["removed_fx_name"] = fx.name
+        with undo_block(
+            f"Remove FX #{fx_index} from track {track_index}"
+        ):
+            RPR.TrackFX_Delete(track.id, fx_index)
+        _forget_displays(track.id)
+        return result
     except ToolError:
         raise
     except Exception as exc:
@@ -220,25 +401,37 @@ def remove_track_fx(
 
 @mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
 def set_track_fx_enabled(
-    track_index: Annotated[int, Field(description="Zero-based track index", ge=0)],
-    fx_index: Annotated[int, Field(description="Zero-based FX slot index", ge=0)],
+    track_index: TrackIndex,
+    fx_index: FxIndex,
     enabled: Annotated[bool, Field(description="True to enable the FX, False to bypass it")],
+    include_names: IncludeNames = False,
 ) -> dict:
-    """Enable or bypass an FX plugin on a track."""
+    """Enable or bypass an FX plugin on a track.
+
+    If the FX is already in the requested state nothing is written and the
+    result carries ``"unchanged": True``.
+    """
+    _invalidate()
     try:
-        project = get_project()
-        track = validate_track_index(project, track_index)
+        project = _cached_project()
+        track = _cached_track(project, track_index)
         fx = validate_fx_index(track, fx_index)
-        with undo_block(
-            f"{'Enable' if enabled else 'Bypass'} FX '{fx.name}' on track '{track.name}'"
-        ):
-            fx.is_enabled = enabled
-        return {
+        result = {
             "track_index": track_index,
             "fx_index": fx_index,
-            "fx_name": fx.name,
             "is_enabled": enabled,
         }
+        if include_names:
+            result["fx_name"] = fx.name
+        # Already in the requested state -- no write, no undo point
+        if fx.is_enabled == enabled:
+            result["unchanged"] = True
+            return result
+        with undo_block(
+            f"{'Enable' if enabled else 'Bypass'} FX #{fx_index} on track {track_index}"
+        ):
+            fx.is_enabled = enabled
+        return result
     except ToolError:
         raise
     except Exception as exc:
@@ -247,19 +440,31 @@ def set_track_fx_enabled(
 
 @mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
 def set_track_fx_param(
-    track_index: Annotated[int, Field(description="Zero-based track index", ge=0)],
-    fx_index: Annotated[int, Field(description="Zero-based FX slot index", ge=0)],
-    param_index: Annotated[int, Field(description="Zero-based parameter index", ge=0)],
-    value: Annotated[float, Field(description="Normalized parameter value (0.0 to 1.0)", ge=0.0, le=1.0)],
+    track_index: TrackIndex,
+    fx_index: FxIndex,
+    param_index: ParamIndex,
+    value: NormalizedValue,
+    return_formatted: Annotated[
+        bool,
+        Field(description="Return the formatted display after setting (adds one round-trip)"),
+    ] = True,
+    return_param_name: Annotated[
+        bool,
+        Field(description="Include the parameter name in the result (adds one round-trip)"),
+    ] = False,
+    include_names: IncludeNames = False,
 ) -> dict:
     """Set a normalized parameter value on a track FX.
 
     The value must be between 0.0 and 1.0. Use get_track_fx_params first
-    to discover available parameters and their current values.
+    to discover available parameters and their current values.  If the
+    parameter already holds *value*, nothing is written and no undo point
+    is created; the result then carries ``"unchanged": True``.
     """
+    _invalidate()
     try:
-        project = get_project()
-        track = validate_track_index(project, track_index)
+        project = _cached_project()
+        track = _cached_track(project, track_index)
         fx = validate_fx_index(track, fx_index)
         if param_index < 0 or param_index >= fx.n_params:
             raise ToolError(
@@ -268,46 +473,124 @@ def set_track_fx_param(
                 f"(valid: 0-{fx.n_params - 1})."
             )
 
-        # Get param name for undo description
-        try:
-            param_name = fx.params[param_index].name
-        except Exception:
-            _, _, _, param_name, _ = RPR.TrackFX_GetParamName(
-                track.id, fx_index, param_index, "", 256
-            )
+        param_name = None
+        if return_param_name:
+            param_name = _param_name(track.id, fx_index, param_index)
 
-        with undo_block(
-            f"Set '{param_name}' to {value:.4f} on '{fx.name}' (track '{track.name}')"
-        ):
-            RPR.TrackFX_SetParamNormalized(track.id, fx_index, param_index, value)
+        prior = RPR.TrackFX_GetParamNormalized(track.id, fx_index, param_index)
+        unchanged = abs(prior - value) < 1e-9
+        if not unchanged:
+            with undo_block(
+                f"Set param #{param_index} to {value:.4f} on FX #{fx_index} "
+                f"(track {track_index})"
+            ):
+                RPR.TrackFX_SetParamNormalized(
+                    track.id, fx_index, param_index, value
+                )
+            _forget_displays(track.id)
 
         # Read back formatted value for confirmation
-        try:
-            formatted = fx.params[param_index].formatted
-        except Exception:
-            _, _, _, formatted, _ = RPR.TrackFX_GetFormattedParamValue(
-                track.id, fx_index, param_index, "", 256
-            )
+        formatted = None
+        if return_formatted:
+            formatted = _param_formatted(track.id, fx_index, param_index)
 
-        return {
+        result = {
             "track_index": track_index,
             "fx_index": fx_index,
-            "fx_name": fx.name,
             "param_index": param_index,
-            "param_name": param_name,
             "value": value,
             "formatted": formatted,
         }
+        if include_names:
+            result["fx_name"] = fx.name
+        if param_name is not None:
+            result["param_name"] = param_name
+        if unchanged:
+            result["unchanged"] = True
+        return result
     except ToolError:
         raise
     except Exception as exc:
         raise ToolError(f"Failed to set FX parameter: {exc}") from exc
 
 
+@mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
+def batch_set_track_fx_params(
+    track_index: TrackIndex,
+    fx_index: FxIndex,
+    updates: Annotated[
+        list[dict],
+        Field(
+            description=(
+                "List of update objects, each with keys: "
+                "'param_index' (int, zero-based) and "
+                "'value' (float, normalized 0.0 to 1.0)."
+            ),
+        ),
+    ],
+) -> dict:
+    """Set several normalized parameter values on one track FX.
+
+    The track and FX are validated once, every update is checked before
+    anything is written, and all writes share a single undo block.  Use
+    this instead of repeated set_track_fx_param calls when automating
+    many parameters of the same plugin.
+    """
+    _invalidate()
+    try:
+        if not updates:
+            raise ToolError("The 'updates' list must not be empty.")
+
+        project = _cached_project()
+        track = _cached_track(project, track_index)
+        fx = validate_fx_index(track, fx_index)
+        n_params = fx.n_params
+
+        # Validate all updates before mutating
+        validated = [None] * len(updates)
+        for i, u in enumerate(updates):
+            if "param_index" not in u or "value" not in u:
+                raise ToolError(
+                    f"Update at index {i} must have 'param_index' and 'value' keys."
+                )
+            param_index = int(u["param_index"])
+            value = float(u["value"])
+            if param_index < 0 or param_index >= n_params:
+                raise ToolError(
+                    f"Update at index {i}: parameter index {param_index} out "
+                    f"of range (valid: 0-{n_params - 1})."
+                )
+            if not 0.0 <= value <= 1.0:
+                raise ToolError(
+                    f"Update at index {i}: value must be 0.0-1.0, got {value}."
+                )
+            validated[i] = (param_index, value)
+
+        track_id = track.id
+        _set = RPR.TrackFX_SetParamNormalized
+        with undo_block(
+            f"Set {len(validated)} params on FX #{fx_index} (track {track_index})"
+        ):
+            with reapy.inside_reaper():  # see list_track_fx
+                for param_index, value in validated:
+                    _set(track_id, fx_index, param_index, value)
+        _forget_displays(track_id)
+
+        return {
+            "track_index": track_index,
+            "fx_index": fx_index,
+            "n_set": len(validated),
+        }
+    except ToolError:
+        raise
+    except Exception as exc:
+        raise ToolError(f"Failed to set FX parameters: {exc}") from exc
+
+
 @mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
 def set_track_fx_preset(
-    track_index: Annotated[int, Field(description="Zero-based track index", ge=0)],
-    fx_index: Annotated[int, Field(description="Zero-based FX slot index", ge=0)],
+    track_index: TrackIndex,
+    fx_index: FxIndex,
     preset_name: Annotated[
         str | None,
         Field(description="Exact preset name to load. Mutually exclusive with delta."),
@@ -316,6 +599,7 @@ def set_track_fx_preset(
         int | None,
         Field(description="Navigate presets by offset (+1 = next, -1 = previous). Mutually exclusive with preset_name."),
     ] = None,
+    include_names: IncludeNames = False,
 ) -> dict:
     """Set or navigate FX presets on a track.
 
@@ -323,6 +607,7 @@ def set_track_fx_preset(
     to step through presets relative to the current one (+1 for next,
     -1 for previous). Exactly one of the two must be specified.
     """
+    _invalidate()
     try:
         if preset_name is None and delta is None:
             raise ToolError(
@@ -333,13 +618,14 @@ def set_track_fx_preset(
                 "Provide either 'preset_name' or 'delta', not both."
             )
 
-        project = get_project()
-        track = validate_track_index(project, track_index)
+        project = _cached_project()
+        track = _cached_track(project, track_index)
         fx = validate_fx_index(track, fx_index)
 
         if preset_name is not None:
             with undo_block(
-                f"Set preset '{preset_name}' on '{fx.name}' (track '{track.name}')"
+                f"Set preset '{preset_name}' on FX #{fx_index} "
+                f"(track {track_index})"
             ):
                 ok = RPR.TrackFX_SetPreset(track.id, fx_index, preset_name)
             if not ok:
@@ -348,7 +634,8 @@ def set_track_fx_preset(
                 )
         else:
             with undo_block(
-                f"Navigate preset by {delta:+d} on '{fx.name}' (track '{track.name}')"
+                f"Navigate preset by {delta:+d} on FX #{fx_index} "
+                f"(track {track_index})"
             ):
                 ok = RPR.TrackFX_NavigatePresets(track.id, fx_index, delta)
             if not ok:
@@ -356,20 +643,24 @@ def set_track_fx_preset(
                     f"Failed to navigate presets by {delta:+d} on FX '{fx.name}'."
                 )
 
+        _forget_displays(track.id)
+
         # Read back current preset state
         _, _, _, new_preset_name, _ = RPR.TrackFX_GetPreset(
-            track.id, fx_index, "", 256
+            track.id, fx_index, _EMPTY, _BUF_SZ
         )
         new_idx, n_presets = RPR.TrackFX_GetPresetIndex(track.id, fx_index)
 
-        return {
+        result = {
             "track_index": track_index,
             "fx_index": fx_index,
-            "fx_name": fx.name,
             "preset_name": new_preset_name,
             "preset_index": new_idx,
             "n_presets": n_presets,
         }
+        if include_names:
+            result["fx_name"] = fx.name
+        return result
     except ToolError:
         raise
     except Exception as exc:
@@ -385,17 +676,25 @@ def copy_track_fx(
         int,
         Field(description="Position in destination FX chain (-1 to append at end)"),
     ] = -1,
+    include_names: IncludeNames = False,
+    dry_run: Annotated[
+        bool,
+        Field(description="Only validate the indices and return the would-be result; nothing is copied"),
+    ] = False,
 ) -> dict:
     """Copy an FX plugin from one track to another.
 
     The FX and all its parameter settings are duplicated to the destination
     track. Use dst_position=-1 to append at the end of the destination chain.
+    With dry_run=true the same checks run but the copy is skipped.
     """
+    if not dry_run:
+        _invalidate()
     try:
-        project = get_project()
-        src_track = validate_track_index(project, src_track_index)
+        project = _cached_project()
+        src_track = _cached_track(project, src_track_index)
         src_fx = validate_fx_index(src_track, src_fx_index)
-        dst_track = validate_track_index(project, dst_track_index)
+        dst_track = _cached_track(project, dst_track_index)
 
         if dst_position >= 0:
             # Validate that dst_position is within a reasonable range
@@ -407,26 +706,31 @@ def copy_track_fx(
                     f"(valid: 0-{dst_n}, or -1 to append)."
                 )
 
-        fx_name = src_fx.name
+        result = {
+            "src_track_index": src_track_index,
+            "src_fx_index": src_fx_index,
+            "dst_track_index": dst_track_index,
+            "dst_position": dst_position,
+        }
+        if include_names:
+            result["src_track_name"] = src_track.name
+            result["fx_name"] = src_fx.name
+            result["dst_track_name"] = dst_track.name
+        if dry_run:
+            result["dry_run"] = True
+            return result
+
         with undo_block(
-            f"Copy FX '{fx_name}' from track '{src_track.name}' "
-            f"to track '{dst_track.name}'"
+            f"Copy FX #{src_fx_index} from track {src_track_index} "
+            f"to track {dst_track_index}"
         ):
             RPR.TrackFX_CopyToTrack(
                 src_track.id, src_fx_index,
                 dst_track.id, dst_position,
                 False,
             )
-
-        return {
-            "src_track_index": src_track_index,
-            "src_track_name": src_track.name,
-            "src_fx_index": src_fx_index,
-            "fx_name": fx_name,
-            "dst_track_index": dst_track_index,
-            "dst_track_name": dst_track.name,
-            "dst_position": dst_position,
-        }
+        _forget_displays(dst_track.id)
+        return result
     except ToolError:
         raise
     except Exception as exc:
@@ -440,9 +744,9 @@ def copy_track_fx(
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
 def probe_fx_param_value(
-    track_index: Annotated[int, Field(description="Zero-based track index", ge=0)],
-    fx_index: Annotated[int, Field(description="Zero-based FX slot index", ge=0)],
-    param_index: Annotated[int, Field(description="Zero-based parameter index", ge=0)],
+    track_index: TrackIndex,
+    fx_index: FxIndex,
+    param_index: ParamIndex,
     target_display: Annotated[
         str,
         Field(description="Target display string to search for (e.g. '1000 Hz', '-6.0 dB')"),
@@ -459,19 +763,25 @@ def probe_fx_param_value(
         int,
         Field(description="Number of probe steps (higher = more precise)", ge=10, le=10000),
     ] = 1000,
+    tolerance: Annotated[
+        float,
+        Field(description="Relative tolerance when comparing numeric displays (e.g. 1e-3 = 0.1%)", ge=0.0, le=1.0),
+    ] = 1e-3,
 ) -> dict:
     """Discover the normalized value that produces a target display string.
 
     Probes the parameter across a range of normalized values, reading
-    the formatted display at each step to find a match.  The original
+    the formatted display at each step to find a match.  When the display
+    is a number with a unit that moves monotonically over the range, the
+    search bisects instead of scanning every step.  The original
     parameter value is ALWAYS restored, making this effectively read-only.
 
     Note: if REAPER crashes during probing the parameter may be left at
     a probed value.  This is extremely unlikely in practice.
     """
     try:
-        project = get_project()
-        track = validate_track_index(project, track_index)
+        project = _cached_project()
+        track = _cached_track(project, track_index)
         fx = validate_fx_index(track, fx_index)
 
         if param_index < 0 or param_index >= fx.n_params:
@@ -493,39 +803,127 @@ def probe_fx_param_value(
         )
         original_value = orig_ret if isinstance(orig_ret, float) else float(orig_ret)
 
-        def _read_display() -> str:
-            """Read the current formatted display via RPR (not cached reapy)."""
-            ret = RPR.TrackFX_GetFormattedParamValue(
-                track.id, fx_index, param_index, "", 256
-            )
-            # [retval, track, fx, param, buf_out, buf_sz]
-            if isinstance(ret, (list, tuple)) and len(ret) >= 5:
-                return str(ret[4])
-            return str(ret)
-
-        original_formatted = _read_display()
+        original_formatted = _param_formatted(track.id, fx_index, param_index)
 
         target_lower = target_display.strip().lower()
+        target = _parse_display(target_display)
+
+        def _matches(shown: str) -> bool:
+            return _display_matches(shown, target_lower, target, tolerance)
         found_value = None
         found_display = None
         restored = False
+        n_probes = 0
+
+        track_id = track.id
+        entries = _display_entries(track_id, fx_index, param_index)
+        _set = RPR.TrackFX_SetParamNormalized
+
+        def _probe(test_val: float) -> str:
+            nonlocal n_probes
+            n_probes += 1
+            # Quantized so near-identical values share a cache entry
+            q = round(test_val, 9)
+            shown = entries.get(q)
+            if shown is None:
+                _set(track_id, fx_index, param_index, q)
+                shown = _param_formatted(track_id, fx_index, param_index)
+                if len(entries) >= _DISPLAY_VALUES_MAX:
+                    entries.clear()
+                entries[q] = shown
+            return shown
+
+        # Already there -- nothing to probe or restore
+        if _matches(original_formatted):
+            return {
+                "found": True,
+                "internal_value": original_value,
+                "matched_display": original_formatted,
+                "target_display": target_display,
+                "original_value": original_value,
+                "original_display": original_formatted,
+                "restored": True,
+                "probe_steps": probe_steps,
+                "probe_min": probe_min,
+                "probe_max": probe_max,
+                "n_probes": 0,
+            }
 
         try:
-            step_size = (probe_max - probe_min) / probe_steps
-            for i in range(probe_steps + 1):
-                test_val = probe_min + (i * step_size)
-                test_val = max(0.0, min(1.0, test_val))
-
-                RPR.TrackFX_SetParamNormalized(
-                    track.id, fx_index, param_index, test_val
-                )
+            # Trust the cache only if it still agrees with the plugin: check
+            # the entry at the original value, or re-probe one sample entry
+            orig_q = round(original_value, 9)
+            if entries:
+                if orig_q in entries:
+                    stale = entries[orig_q] != original_formatted
+                else:
+                    sample, cached = next(iter(entries.items()))
+                    _set(track_id, fx_index, param_index, sample)
+                    stale = _param_formatted(track_id, fx_index, param_index) != cached
+                if stale:
+                    entries.clear()
+            entries[orig_q] = original_formatted
 
-                formatted = _read_display()
+            step_size = (probe_max - probe_min) / probe_steps
 
-                if formatted.strip().lower() == target_lower:
-                    found_value = test_val
-                    found_display = formatted
-                    break
+            # Fast path: bisect on the parsed number when the display is
+            # monotonic over the range.  Narrowing to 1e-9 costs ~30
+            # probes and still lands on display values that fall between
+            # two steps of the linear grid.
+            scan = True
+            if target is not None:
+                t_num, t_unit = target
+                lo, hi = probe_min, probe_max
+                mid = (lo + hi) / 2
+                anchors = [_probe(lo), _probe(mid), _probe(hi)]
+                for val, shown in zip((lo, mid, hi), anchors):
+                    if _matches(shown):
+                        found_value, found_display = val, shown
+                        break
+                parsed = [_parse_display(a) for a in anchors]
+                if found_value is not None:
+                    scan = False
+                elif all(p is not None and p[1] == t_unit for p in parsed):
+                    d_lo, d_mid, d_hi = (p[0] for p in parsed)
+                    rising = d_lo <= d_mid <= d_hi and d_lo < d_hi
+                    falling = d_lo >= d_mid >= d_hi and d_lo > d_hi
+                    if rising or falling:
+                        scan = False
+                        if min(d_lo, d_hi) <= t_num <= max(d_lo, d_hi):
+                            d = d_mid
+                            while True:
+                                if (d < t_num) == rising:
+                                    lo = mid
+                                else:
+                                    hi = mid
+                                if hi - lo <= 1e-9:
+                                    break
+                                mid = (lo + hi) / 2
+                                shown = _probe(mid)
+                                if _matches(shown):
+                                    found_value, found_display = mid, shown
+                                    break
+                                p = _parse_display(shown)
+                                if p is None or p[1] != t_unit:
+                                    scan = True  # not what the anchors said
+                                    break
+                                d = p[0]
+
+            # Fallback: linear scan over the whole grid
+            if scan:
+                # probe_min/probe_max are already within [0, 1]; only the
+                # float error on the last steps can overshoot
+                grid = [
+                    min(1.0, probe_min + i * step_size)
+                    for i in range(probe_steps + 1)
+                ]
+                for test_val in grid:
+                    formatted = _probe(test_val)
+
+                    if _matches(formatted):
+                        found_value = test_val
+                        found_display = formatted
+                        break
         finally:
             # ALWAYS restore original value
             RPR.TrackFX_SetParamNormalized(
@@ -544,6 +942,7 @@ def probe_fx_param_value(
             "probe_steps": probe_steps,
             "probe_min": probe_min,
             "probe_max": probe_max,
+            "n_probes": n_probes,
         }
     except ToolError:
         raise
@@ -7,6 +7,7 @@ from typing import Annotated
 from pydantic import Field
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
+import reapy
 
 from scythe.helpers import (
     get_project,
@@ -172,9 +173,11 @@ def set_track_name(
     try:
         project = get_project()
         track = validate_track_index(project, track_index)
-        with undo_block("Set track name"):
+        # Read back under the same hold as the write
+        with undo_block("Set track name"), reapy.inside_reaper():
             track.name = name
-        return {"index": track_index, "name": track.name}
+            applied = track.name
+        return {"index": track_index, "name": applied}
     except ToolError:
         raise
     except Exception as exc:
@@ -190,11 +193,12 @@ def set_track_volume(
     try:
         project = get_project()
         track = validate_track_index(project, track_index)
-        with undo_block("Set track volume"):
+        with undo_block("Set track volume"), reapy.inside_reaper():
             track.set_info_value("D_VOL", db_to_linear(volume_db))
+            applied = track.get_info_value("D_VOL")
         return {
             "index": track_index,
-            "volume_db": linear_to_db(track.get_info_value("D_VOL")),
+            "volume_db": linear_to_db(applied),
         }
     except ToolError:
         raise
@@ -211,11 +215,12 @@ def set_track_pan(
     try:
         project = get_project()
         track = validate_track_index(project, track_index)
-        with undo_block("Set track pan"):
+        with undo_block("Set track pan"), reapy.inside_reaper():
             track.set_info_value("D_PAN", pan)
+            applied = track.get_info_value("D_PAN")
         return {
             "index": track_index,
-            "pan": track.get_info_value("D_PAN"),
+            "pan": applied,
         }
     except ToolError:
         raise
@@ -245,15 +250,16 @@ def set_track_mute_solo(
     try:
         project = get_project()
         track = validate_track_index(project, track_index)
-        with undo_block("Set track mute/solo"):
+        with undo_block("Set track mute/solo"), reapy.inside_reaper():
             if mute is not None:
                 track.is_muted = mute
             if solo is not None:
                 track.is_solo = solo
+            muted, soloed = track.is_muted, track.is_solo
         return {
             "index": track_index,
-            "muted": track.is_muted,
-            "soloed": track.is_solo,
+            "muted": muted,
+            "soloed": soloed,
         }
     except ToolError:
         raise
@@ -270,11 +276,12 @@ def set_track_record_arm(
     try:
         project = get_project()
         track = validate_track_index(project, track_index)
-        with undo_block("Set track record arm"):
+        with undo_block("Set track record arm"), reapy.inside_reaper():
             track.set_info_value("I_RECARM", int(armed))
+            applied = bool(track.get_info_value("I_RECARM"))
         return {
             "index": track_index,
-            "armed": bool(track.get_info_value("I_RECARM")),
+            "armed": applied,
         }
     except ToolError:
         raise
@@ -303,3 +310,66 @@ def set_track_color(
         raise
     except Exception as exc:
         raise ToolError(f"Failed to set track color: {exc}") from exc
+
+
+@mcp.tool(annotations={"readOnlyHint": False, "openWorldHint": False})
+def set_track_properties(
+    track_index: TrackIndex,
+    name: Annotated[
+        str | None,
+        Field(description="New track name. Omit to leave unchanged."),
+    ] = None,
+    volume_db: Annotated[VolumeDb | None, Field(description="Volume in decibels (0.0 = unity gain). Omit to leave unchanged.")] = None,
+    pan: Annotated[PanValue | None, Field(description="Pan from -1.0 (full left) to 1.0 (full right). Omit to leave unchanged.")] = None,
+    mute: Annotated[
+        bool | None,
+        Field(description="Mute state. Omit to leave unchanged."),
+    ] = None,
+    solo: Annotated[
+        bool | None,
+        Field(description="Solo state. Omit to leave unchanged."),
+    ] = None,
+    armed: Annotated[
+        bool | None,
+        Field(description="Record arm state. Omit to leave unchanged."),
+    ] = None,
+    r: Annotated[ColorChannel | None, Field(description="Red channel (0-255); give r, g and b together")] = None,
+    g: Annotated[ColorChannel | None, Field(description="Green channel (0-255)")] = None,
+    b: Annotated[ColorChannel | None, Field(description="Blue channel (0-255)")] = None,
+) -> dict:
+    """Set several track properties at once and return the resulting state.
+
+    Only the provided fields are changed, all inside one undo block.  The
+    result is the same summary list_tracks returns for the track, read
+    after the changes -- no separate get_track_info call is needed.
+    """
+    color = (r, g, b)
+    if any(c is not None for c in color) and any(c is None for c in color):
+        raise ToolError("Provide all of 'r', 'g' and 'b' to set the color.")
+    if all(v is None for v in (name, volume_db, pan, mute, solo, armed, r)):
+        raise ToolError("Provide at least one property to set.")
+    try:
+        project = get_project()
+        # One held connection for the writes and the read-back
+        with reapy.inside_reaper():
+            track = validate_track_index(project, track_index)
+            with undo_block("Set track properties"):
+                if name is not None:
+                    track.name = name
+                if volume_db is not None:
+                    track.set_info_value("D_VOL", db_to_linear(volume_db))
+                if pan is not None:
+                    track.set_info_value("D_PAN", pan)
+                if mute is not None:
+                    track.is_muted = mute
+                if solo is not None:
+                    track.is_solo = solo
+                if armed is not None:
+                    track.set_info_value("I_RECARM", int(armed))
+                if r is not None:
+                    track.color = color
+            return _track_summary(track, track_index)
+    except ToolError:
+        raise
+    except Exception as exc:
+        raise ToolError(f"Failed to set track properties: {exc}") from exc
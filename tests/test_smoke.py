@@ -4,15 +4,24 @@ Creates a fresh empty project tab, runs all tests there, then closes it
 so the user's original project is never touched.
 
 Usage:
-    python tests/test_smoke.py
+    python tests/test_smoke.py [--watch]
+
+With --watch the suite re-runs whenever a file under scythe/ changes,
+reusing the same connection and scratch project tab between runs.
+
+Per-test results are printed together once the run finishes; set
+SCYTHE_TEST_VERBOSE=1 to see them live, with tracebacks for failures.
 
 Requirements:
     - REAPER running with "Activate reapy server" action active
     - python-reapy and fastmcp installed
 """
 
+import argparse
+import importlib
 import os
 import sys
+import time
 import traceback
 
 # Bootstrap imports so this works from repo root without pip install
@@ -44,19 +53,52 @@ from scythe.tools import (
 
 _results: list[tuple[str, bool, str]] = []
 
+# Per-test output, written in one go by _flush_log() unless verbose
+_log: list[str] = []
+_VERBOSE = bool(os.environ.get("SCYTHE_TEST_VERBOSE"))
+
+
+def _emit(line: str):
+    """Print *line* now in verbose mode, otherwise buffer it."""
+    if _VERBOSE:
+        print(line)
+    else:
+        _log.append(line)
+
+
+def _flush_log():
+    """Write and clear the buffered test output."""
+    if _log:
+        sys.stdout.write("\n".join(_log) + "\n")
+        sys.stdout.flush()
+        _log.clear()
+
 
 def run_test(name: str, fn):
-    """Run a test function, catch exceptions, record result."""
+    """Run a test function, catch exceptions, record result.
+
+    The test body runs inside ``reapy.inside_reaper()``, which holds the
+    reapy server on this connection so every call in the test is answered
+    immediately instead of waiting for REAPER's next defer cycle.  Reads
+    still see the preceding writes, so tests need no restructuring.
+    """
     try:
-        fn()
+        with reapy.inside_reaper():
+            fn()
         _results.append((name, True, ""))
-        print(f"  PASS  {name}")
+        _emit(f"  PASS  {name}")
     except Exception as e:
-        msg = f"{type(e).__name__}: {e}"
+        if isinstance(e, reapy.errors.DistError):
+            # Raised inside REAPER -- the message embeds the whole remote
+            # traceback, so keep just its last line for the summary
+            lines = str(e).strip().splitlines()
+            msg = f"DistError: {lines[-1] if lines else e}"
+        else:
+            msg = f"{type(e).__name__}: {e}"
         _results.append((name, False, msg))
-        print(f"  FAIL  {name}")
-        print(f"        {msg}")
-        if os.environ.get("SCYTHE_TEST_VERBOSE"):
+        _emit(f"  FAIL  {name}")
+        _emit(f"        {msg}")
+        if _VERBOSE:
             traceback.print_exc()
 
 
@@ -66,32 +108,64 @@ def run_test(name: str, fn):
 
 _original_project_name: str = ""
 
+# Handle to the scratch project, resolved once in setup_test_project() and
+# used by teardown to close exactly that tab
+_project: reapy.Project | None = None
+
+# Native REAPER action IDs -- fixed numbers, so no NamedCommandLookup needed
+_CMD_NEW_TAB = 41929    # New project tab
+_CMD_CLOSE_TAB = 40860  # Close current project tab
+_CMD_STOP = 1016        # Transport: Stop
+
+
+def _project_tab_new_and_capture() -> reapy.Project:
+    """Open a new project tab and return it, under one hold."""
+    with reapy.inside_reaper():
+        RPR.Main_OnCommand(_CMD_NEW_TAB, 0)
+        # The new (empty) project is now the active one
+        return reapy.Project()
+
+
+def _project_tab_stop_and_close(scratch: reapy.Project) -> reapy.Project:
+    """Stop transport, close *scratch*'s tab and return the one now active."""
+    with reapy.inside_reaper():
+        # Close-tab acts on the active tab; make sure that's the scratch
+        # one, even if a test or the user switched tabs meanwhile
+        RPR.SelectProjectInstance(scratch.id)
+        RPR.Main_OnCommand(_CMD_STOP, 0)
+        RPR.Main_OnCommand(_CMD_CLOSE_TAB, 0)
+        return reapy.Project()
+
 
 def setup_test_project():
     """Open a new empty project tab for testing.
 
-    REAPER action 41929 = 'New project tab'.  This leaves the user's
-    current project untouched in its own tab.
+    This leaves the user's current project untouched in its own tab.
     """
-    global _original_project_name
-    _original_project_name = reapy.Project().name or "(untitled)"
-    RPR.Main_OnCommand(41929, 0)  # New project tab
-    # The new (empty) project is now the active one
-    p = reapy.Project()
-    print(f"  Test project created: {p.name or '(empty)'}")
+    global _original_project_name, _project
+    # Both name reads share the tab switch's hold
+    with reapy.inside_reaper():
+        _original_project_name = reapy.Project().name or "(untitled)"
+        _project = _project_tab_new_and_capture()
+        created = _project.name or "(empty)"
+    print(f"  Test project created: {created}")
 
 
 def teardown_test_project():
     """Close the scratch project tab without saving.
 
-    REAPER action 40860 = 'Close current project tab'.
-    We first make sure transport is stopped, then close.
+    Transport is stopped first so the tab can close cleanly.
     """
+    global _project
+    if _project is None:
+        return  # setup never got as far as opening the tab
     try:
-        RPR.Main_OnCommand(1016, 0)   # Transport: Stop
-        RPR.Main_OnCommand(40860, 0)   # Close current project tab
-        p = reapy.Project()
-        restored = p.name or "(untitled)"
+        # A different tab is active afterwards, so it's resolved afresh;
+        # its name is read under the same hold as the close
+        with reapy.inside_reaper():
+            p = _project_tab_stop_and_close(_project)
+            restored = p.name or "(untitled)"
+        _project = None  # the scratch tab is gone
         print(f"  Restored original project: {restored}")
     except Exception as e:
         print(f"  WARNING: Failed to close test project tab: {e}")
@@ -119,19 +193,23 @@ def _delete_test_track(idx):
 # ---------------------------------------------------------------------------
 
 
+# Keys each read-only tool result must carry
+_PROJECT_INFO_KEYS = frozenset({"name", "bpm", "n_tracks", "sample_rate"})
+_TRANSPORT_KEYS = frozenset({"is_playing", "is_stopped", "cursor_position"})
+_AUDIO_DEVICE_KEYS = frozenset({"n_inputs", "n_outputs"})
+_MIDI_DEVICE_KEYS = frozenset({"midi_inputs", "midi_outputs"})
+_ENVELOPE_KEYS = frozenset({"n_envelopes", "envelopes"})
+
+
 def test_project_info():
     result = project.get_project_info()
-    assert "name" in result, "Missing 'name' key"
-    assert "bpm" in result, "Missing 'bpm' key"
-    assert "n_tracks" in result, "Missing 'n_tracks' key"
+    assert _PROJECT_INFO_KEYS <= result.keys(), f"Missing {_PROJECT_INFO_KEYS - result.keys()}"
     assert result["sample_rate"] > 0, "Invalid sample rate"
 
 
 def test_transport_state():
     result = project.get_transport_state()
-    assert "is_playing" in result, "Missing 'is_playing' key"
-    assert "is_stopped" in result, "Missing 'is_stopped' key"
-    assert "cursor_position" in result, "Missing 'cursor_position' key"
+    assert _TRANSPORT_KEYS <= result.keys(), f"Missing {_TRANSPORT_KEYS - result.keys()}"
 
 
 def test_cursor_position():
@@ -143,47 +221,43 @@ def test_cursor_position():
 
 def test_track_lifecycle():
     """Create a track, modify it, then delete it."""
-    n_before = project.get_project_info()["n_tracks"]
+    n_before = project.get_project_snapshot()["n_tracks"]
 
     # Create
     idx = _add_test_track("__scythe_lifecycle__")
 
     # Verify count
-    assert project.get_project_info()["n_tracks"] == n_before + 1, "Track not added"
+    assert project.get_project_snapshot()["n_tracks"] == n_before + 1, "Track not added"
 
-    # Rename
-    tracks.set_track_name(track_index=idx, name="__scythe_renamed__")
-    info = tracks.get_track_info(track_index=idx)
+    # Rename, volume, pan, mute and arm in one call, checked on the result
+    info = tracks.set_track_properties(
+        track_index=idx, name="__scythe_renamed__",
+        volume_db=-6.0, pan=0.5, mute=True, armed=True,
+    )
     assert info["name"] == "__scythe_renamed__", "Rename failed"
-
-    # Volume
-    tracks.set_track_volume(track_index=idx, volume_db=-6.0)
-    info = tracks.get_track_info(track_index=idx)
     assert abs(info["volume_db"] - (-6.0)) < 0.5, "Volume not set"
-
-    # Pan
-    tracks.set_track_pan(track_index=idx, pan=0.5)
-    info = tracks.get_track_info(track_index=idx)
     assert abs(info["pan"] - 0.5) < 0.1, "Pan not set"
-
-    # Mute/Solo
-    tracks.set_track_mute_solo(track_index=idx, mute=True)
-    info = tracks.get_track_info(track_index=idx)
     assert info["muted"] is True, "Mute not set"
-    tracks.set_track_mute_solo(track_index=idx, mute=False)
+    assert info["armed"] is True, "Arm not set"
+
+    # Individual setters, each checked on the value it reports back
+    result = tracks.set_track_name(track_index=idx, name="__scythe_lifecycle__")
+    assert result["name"] == "__scythe_lifecycle__", f"Rename failed: {result}"
+    result = tracks.set_track_volume(track_index=idx, volume_db=0.0)
+    assert abs(result["volume_db"]) < 0.5, f"Volume not reset: {result}"
+    result = tracks.set_track_pan(track_index=idx, pan=0.0)
+    assert abs(result["pan"]) < 0.1, f"Pan not reset: {result}"
+    result = tracks.set_track_mute_solo(track_index=idx, mute=False)
+    assert result["muted"] is False, f"Mute not cleared: {result}"
+    result = tracks.set_track_record_arm(track_index=idx, armed=False)
+    assert result["armed"] is False, f"Arm not cleared: {result}"
 
     # Color
     tracks.set_track_color(track_index=idx, r=255, g=0, b=0)
 
-    # Arm
-    tracks.set_track_record_arm(track_index=idx, armed=True)
-    info = tracks.get_track_info(track_index=idx)
-    assert info["armed"] is True, "Arm not set"
-    tracks.set_track_record_arm(track_index=idx, armed=False)
-
     # Delete
     _delete_test_track(idx)
-    assert project.get_project_info()["n_tracks"] == n_before, "Track not deleted"
+    assert project.get_project_snapshot()["n_tracks"] == n_before, "Track not deleted"
 
 
 def test_list_tracks():
@@ -251,8 +325,9 @@ def test_send_lifecycle():
         )
 
         # Mute/unmute
-        sends.set_send_mute(track_index=src_idx, send_index=send_idx, muted=True)
-        sends.set_send_mute(track_index=src_idx, send_index=send_idx, muted=False)
+        toggle = sends.verify_mute_toggle(track_index=src_idx, send_index=send_idx)
+        assert toggle["mute_applied"], f"Send mute not applied: {toggle}"
+        assert not toggle["muted"], f"Send mute not restored: {toggle}"
 
         # Remove send
         sends.remove_send(track_index=src_idx, send_index=send_idx)
@@ -263,27 +338,24 @@ def test_send_lifecycle():
 
 
 def test_marker_lifecycle():
-    """Add a marker, list it, then delete it."""
+    """Add a marker, check its read-back position, then delete it."""
     pos = 999.0
     result = markers.add_marker(position=pos, name="__scythe_test__")
     idx = result["index"]
 
-    # Verify by position (names aren't readable via dist API)
-    listing = markers.list_markers()
-    found = any(abs(m["position"] - pos) < 0.1 for m in listing["markers"])
-    assert found, "Marker not found in listing"
+    # add_marker reads the position back, so no listing is needed
+    assert abs(result["position"] - pos) < 0.1, f"Marker position mismatch: {result}"
 
     markers.delete_marker_or_region(index=idx, is_region=False)
 
 
 def test_region_lifecycle():
-    """Add a region, list it, then delete it."""
+    """Add a region, check its read-back bounds, then delete it."""
     result = markers.add_region(start=990.0, end=995.0, name="__scythe_test__")
     idx = result["index"]
 
-    listing = markers.list_regions()
-    found = any(abs(r["position"] - 990.0) < 0.1 for r in listing["regions"])
-    assert found, "Region not found in listing"
+    assert abs(result["start"] - 990.0) < 0.1, f"Region start mismatch: {result}"
+    assert abs(result["end"] - 995.0) < 0.1, f"Region end mismatch: {result}"
 
     markers.delete_marker_or_region(index=idx, is_region=True)
 
@@ -313,13 +385,14 @@ def test_item_lifecycle():
         items.set_item_length(track_index=idx, item_index=0, length=6.0)
 
         # Split
-        items.split_item(track_index=idx, item_index=0, position=5.0)
-        listing2 = items.list_items_on_track(track_index=idx)
-        assert listing2["n_items"] >= 2, "Split didn't create second item"
+        split_result = items.split_item(track_index=idx, item_index=0, position=5.0)
+        assert split_result["n_items"] >= 2, "Split didn't create second item"
+        assert split_result["new_item_index"] == 1, f"Unexpected split result: {split_result}"
 
-        # Delete both items (reverse order)
-        for i in range(listing2["n_items"] - 1, -1, -1):
-            items.delete_item(track_index=idx, item_index=i)
+        # Delete both items at once
+        items.delete_items(
+            track_index=idx, item_indices=list(range(split_result["n_items"]))
+        )
     finally:
         _delete_test_track(idx)
 
@@ -332,11 +405,15 @@ def test_midi_lifecycle():
         # Create MIDI item
         midi.create_midi_item(track_index=idx, position=0.0, length=4.0)
 
-        # Add note (C4, velocity 100, beat 0 to beat 1 = 0 to 960 PPQ)
-        midi.add_midi_note(
+        # Add a note (C4, velocity 100, beat 0 to beat 1 = 0 to 960 PPQ)
+        # and a CC in one call
+        added = midi.add_midi_events(
             track_index=idx, item_index=0,
-            pitch=60, velocity=100, start_ppq=0, end_ppq=960,
+            notes=[{"pitch": 60, "velocity": 100, "start_ppq": 0, "end_ppq": 960}],
+            ccs=[{"cc_num": 1, "value": 64, "ppq_position": 0}],
         )
+        assert added["n_notes_added"] == 1, f"Unexpected result: {added}"
+        assert added["n_cc_added"] == 1, f"Unexpected result: {added}"
 
         # List notes
         notes = midi.list_midi_notes(track_index=idx, item_index=0)
@@ -347,12 +424,6 @@ def test_midi_lifecycle():
             track_index=idx, item_index=0, note_index=0, velocity=80
         )
 
-        # Add CC
-        midi.add_midi_cc(
-            track_index=idx, item_index=0,
-            cc_num=1, value=64, ppq_position=0,
-        )
-
         # List CC
         cc_list = midi.list_midi_cc(track_index=idx, item_index=0)
         assert cc_list["n_cc_events"] >= 1, "CC not listed"
@@ -372,7 +443,7 @@ def test_envelopes():
     idx = _add_test_track("__scythe_env_test__")
     try:
         result = envelopes.list_track_envelopes(track_index=idx)
-        assert "envelopes" in result, "Missing 'envelopes' key"
+        assert _ENVELOPE_KEYS <= result.keys(), f"Missing {_ENVELOPE_KEYS - result.keys()}"
     finally:
         _delete_test_track(idx)
 
@@ -460,21 +531,22 @@ def test_probe_fx_param():
 
 
 def test_time_selection():
-    """Set and get time selection, then clear it."""
-    time_selection.set_time_selection(start=2.0, end=8.0)
-    result = time_selection.get_time_selection()
+    """Set time selection, check the read-back range, then clear it."""
+    result = time_selection.set_time_selection(start=2.0, end=8.0)
     assert abs(result["start"] - 2.0) < 0.1, f"Start not set, got {result['start']}"
     assert abs(result["end"] - 8.0) < 0.1, f"End not set, got {result['end']}"
     # Clear
-    time_selection.set_time_selection(start=0.0, end=0.0)
+    cleared = time_selection.set_time_selection(start=0.0, end=0.0)
+    assert cleared["length"] == 0.0, f"Selection not cleared: {cleared}"
 
 
 def test_loop():
     """Toggle loop on and off."""
-    time_selection.set_loop(enabled=True, start=1.0, end=5.0)
-    result = time_selection.get_time_selection()
+    result = time_selection.set_loop(enabled=True, start=1.0, end=5.0)
     assert result["loop_enabled"] is True, "Loop not enabled"
-    time_selection.set_loop(enabled=False)
+    assert abs(result["loop_start"] - 1.0) < 0.1, f"Loop start not set: {result}"
+    result = time_selection.set_loop(enabled=False)
+    assert result["loop_enabled"] is False, "Loop not disabled"
 
 
 def test_ext_state():
@@ -490,9 +562,9 @@ def test_ext_state():
 def test_devices():
     """List audio and MIDI devices (read-only)."""
     audio = devices.list_audio_devices()
-    assert "n_inputs" in audio, "Missing 'n_inputs'"
+    assert _AUDIO_DEVICE_KEYS <= audio.keys(), f"Missing {_AUDIO_DEVICE_KEYS - audio.keys()}"
     midi_devs = devices.list_midi_devices()
-    assert "midi_inputs" in midi_devs, "Missing 'midi_inputs'"
+    assert _MIDI_DEVICE_KEYS <= midi_devs.keys(), f"Missing {_MIDI_DEVICE_KEYS - midi_devs.keys()}"
 
 
 def test_actions():
@@ -505,8 +577,136 @@ def test_actions():
 # Runner
 # ---------------------------------------------------------------------------
 
+# Tests that only read, or only touch state they create and remove themselves
+READ_ONLY = [
+    ("project_info", test_project_info),
+    ("transport_state", test_transport_state),
+    ("list_tracks", test_list_tracks),
+    ("tempo_info", test_tempo_info),
+    ("ext_state", test_ext_state),
+    ("devices", test_devices),
+]
+
+STATEFUL = [
+    ("cursor_position", test_cursor_position),
+    ("track_lifecycle", test_track_lifecycle),
+    ("track_fx_lifecycle", test_track_fx_lifecycle),
+    ("send_lifecycle", test_send_lifecycle),
+    ("marker_lifecycle", test_marker_lifecycle),
+    ("region_lifecycle", test_region_lifecycle),
+    ("item_lifecycle", test_item_lifecycle),
+    ("midi_lifecycle", test_midi_lifecycle),
+    ("envelopes", test_envelopes),
+    ("fx_envelope_lifecycle", test_fx_envelope_lifecycle),
+    ("probe_fx_param", test_probe_fx_param),
+    ("time_selection", test_time_selection),
+    ("loop", test_loop),
+    ("actions", test_actions),
+]
+
+
+# Tests per reapy.inside_reaper() hold; the hold is released in between so
+# REAPER's main loop can run and one stuck test can't pin it for the suite
+_HOLD_BATCH = 4
+
+
+def _run_in_holds(tests):
+    """Run *tests* in order, a few at a time under one hold each."""
+    for start in range(0, len(tests), _HOLD_BATCH):
+        with reapy.inside_reaper():
+            for name, fn in tests[start:start + _HOLD_BATCH]:
+                run_test(name, fn)
+
+
+def _run_suite() -> int:
+    """Run every test, print the summary and return the failure count."""
+    _results.clear()
+    try:
+        # Read-only tests go first, then the stateful ones in logical
+        # order.  They aren't threaded or pipelined (asyncio.to_thread
+        # included): reapy routes every call through a single shared
+        # client socket with no locking, so overlapping requests would
+        # interleave on the wire -- only one can be in flight at a time.
+        _run_in_holds(READ_ONLY + STATEFUL)
+    finally:
+        _flush_log()
+
+    passed = sum(1 for _, ok, _ in _results if ok)
+    failed = sum(1 for _, ok, _ in _results if not ok)
+    total = len(_results)
+
+    print()
+    print("-" * 60)
+    print(f"  {passed}/{total} passed, {failed} failed")
+
+    if failed:
+        print()
+        print("  Failed tests:")
+        for name, ok, msg in _results:
+            if not ok:
+                print(f"    - {name}: {msg}")
+
+    print("-" * 60)
+    print()
+    return failed
+
+
+# ---------------------------------------------------------------------------
+# Watch mode
+# ---------------------------------------------------------------------------
+
+_WATCH_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scythe"
+)
+_WATCH_POLL = 0.5  # seconds between mtime scans
+
+
+def _source_mtimes() -> dict[str, float]:
+    """Return the mtime of every .py file under scythe/."""
+    mtimes = {}
+    for root, _dirs, files in os.walk(_WATCH_DIR):
+        for f in files:
+            if f.endswith(".py"):
+                path = os.path.join(root, f)
+                try:
+                    mtimes[path] = os.stat(path).st_mtime
+                except OSError:
+                    pass  # removed mid-scan
+    return mtimes
+
+
+def _wait_for_change():
+    """Block until a file under scythe/ is added, removed or modified."""
+    before = _source_mtimes()
+    while _source_mtimes() == before:
+        time.sleep(_WATCH_POLL)
+
+
+def _reload_tools():
+    """Reload scythe.helpers and the tool modules the tests call into."""
+    importlib.reload(sys.modules["scythe.helpers"])
+    for module in (
+        project, tracks, track_fx, sends, markers, tempo, items, midi,
+        envelopes, time_selection, actions, ext_state, devices, render,
+    ):
+        # reload() reuses the module object, so the names bound at import
+        # time above pick up the new code
+        importlib.reload(module)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Scythe smoke tests")
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="re-run the suite whenever a file under scythe/ changes",
+    )
+    args = parser.parse_args()
+
     print()
     print("=" * 60)
     print("  Scythe Smoke Tests")
@@ -514,7 +714,9 @@ def main():
     print("=" * 60)
     print()
 
-    # Connection check
+    # Connection check.  This first call also warms the connection before
+    # any test runs; reapy's Socket already sets TCP_NODELAY, so there are
+    # no Nagle / delayed-ACK stalls to tune away.
     try:
         p = reapy.Project()
         print(f"  Connected to REAPER: {p.name or '(untitled project)'}")
@@ -525,57 +727,35 @@ def main():
 
     print()
 
-    # Create isolated test project
+    # Create isolated test project -- once, even in watch mode
     print("  Setting up test project...")
     setup_test_project()
     print()
 
+    failed = 0
     try:
-        # Run tests in logical order
-        run_test("project_info", test_project_info)
-        run_test("transport_state", test_transport_state)
-        run_test("cursor_position", test_cursor_position)
-        run_test("list_tracks", test_list_tracks)
-        run_test("track_lifecycle", test_track_lifecycle)
-        run_test("track_fx_lifecycle", test_track_fx_lifecycle)
-        run_test("send_lifecycle", test_send_lifecycle)
-        run_test("marker_lifecycle", test_marker_lifecycle)
-        run_test("region_lifecycle", test_region_lifecycle)
-        run_test("tempo_info", test_tempo_info)
-        run_test("item_lifecycle", test_item_lifecycle)
-        run_test("midi_lifecycle", test_midi_lifecycle)
-        run_test("envelopes", test_envelopes)
-        run_test("fx_envelope_lifecycle", test_fx_envelope_lifecycle)
-        run_test("probe_fx_param", test_probe_fx_param)
-        run_test("time_selection", test_time_selection)
-        run_test("loop", test_loop)
-        run_test("ext_state", test_ext_state)
-        run_test("devices", test_devices)
-        run_test("actions", test_actions)
+        failed = _run_suite()
+        while args.watch:
+            print("  Watching scythe/ for changes (Ctrl+C to stop)...")
+            _wait_for_change()
+            print()
+            print("  Change detected, reloading and re-running...")
+            print()
+            try:
+                _reload_tools()
+            except Exception as e:
+                # A half-saved file shouldn't end the session
+                print(f"  Reload failed: {type(e).__name__}: {e}")
+                print()
+                continue
+            failed = _run_suite()
+    except KeyboardInterrupt:
+        print()
     finally:
         # Always clean up — close the test tab, restore original project
-        print()
         print("  Tearing down test project...")
         teardown_test_project()
-
-    # Summary
-    passed = sum(1 for _, ok, _ in _results if ok)
-    failed = sum(1 for _, ok, _ in _results if not ok)
-    total = len(_results)
-
-    print()
-    print("-" * 60)
-    print(f"  {passed}/{total} passed, {failed} failed")
-
-    if failed:
         print()
-        print("  Failed tests:")
-        for name, ok, msg in _results:
-            if not ok:
-                print(f"    - {name}: {msg}")
-
-    print("-" * 60)
-    print()
 
     sys.exit(1 if failed else 0)
 